@@ -34,10 +34,12 @@ hero_main_top15_FINAL_STABLE_PATCHED_P2PLUS.py
 - DATE_FETCH_RANK1_ONLY (default 1)  # ✅ rank=1만 날짜추출
 - CAMPAIGN_DATE_CACHE_TTL_DAYS (default 14)  # ✅ 캐시 TTL
 - HTML_USE_ABSOLUTE_FILE_URL
+- BLOCK_HEAVY_RESOURCES (default 1)  # font/media/websocket/트래킹 요청 차단
 """
 
-import os, re, csv, hashlib, urllib.parse, sys, time, json, traceback, html, smtplib
+import os, re, csv, hashlib, urllib.parse, sys, time, json, traceback, html, smtplib, functools, gzip
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Tuple, Dict, Any
@@ -208,6 +210,11 @@ CAMPAIGN_META_RANK_LIMIT = max(1, int(os.environ.get("CAMPAIGN_META_RANK_LIMIT",
 CAMPAIGN_META_CACHE_TTL_DAYS = max(1, int(os.environ.get("CAMPAIGN_META_CACHE_TTL_DAYS", "7")))
 ENABLE_OCR = os.environ.get("ENABLE_OCR", "0") == "1"
 
+# 배너 DOM과 무관한 리소스(폰트/영상/웹소켓/트래킹) 차단 → 로딩/networkidle 단축
+BLOCK_HEAVY_RESOURCES = os.environ.get("BLOCK_HEAVY_RESOURCES", "1") != "0"
+BLOCKED_RESOURCE_TYPES = {"font", "media", "websocket"}
+BLOCKED_URL_TOKENS = ("google-analytics", "googletagmanager", "doubleclick", "hotjar", "facebook.net")
+
 USER_AGENT = os.environ.get(
     "USER_AGENT",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -225,6 +232,10 @@ RECENT_CHANGE_DAYS = max(1, int(os.environ.get("RECENT_CHANGE_DAYS", "7")))
 SECTION_SCAN_Y_MAX = max(1800, int(os.environ.get("SECTION_SCAN_Y_MAX", "6000")))
 DEEP_SCAN_NODE_LIMIT = max(400, int(os.environ.get("DEEP_SCAN_NODE_LIMIT", "2200")))
 
+# HTML 출력: 사전 빌드된 tailwind css 경로(지정 시 CDN JIT 런타임 대신 사용) + gzip 사본
+TAILWIND_CSS_HREF = os.environ.get("TAILWIND_CSS_HREF", "").strip()
+HTML_WRITE_GZIP = os.environ.get("HTML_WRITE_GZIP", "1") != "0"
+
 
 
 # =====================================================
@@ -632,6 +643,11 @@ def choose_title(*cands: str) -> str:
         return clean_campaign_title(c[0])
     return "메인 배너"
 
+@functools.lru_cache(maxsize=4096)
+def _fname_title(img_url: str) -> str:
+    """이미지 파일명 → 타이틀 후보 (url decode, 동일 url 반복 호출 캐시)"""
+    return urllib.parse.unquote(img_url.rsplit("/", 1)[-1]) if img_url else ""
+
 def normalize_href(href: str) -> str:
     """dedupe용: utm/fbclid/NaPm 등 제거한 canonical href"""
     href = (href or "").strip()
@@ -788,6 +804,7 @@ def save_and_resize_image(context, img_url: str, brand_key: str, rank: int, refe
     """
     returns: (local_filename, status)
       status: ok / cached / download_fail / blocked_html / http_403 / http_429 / http_xxx / no_url / exception
+    ASSET_DIR는 main() 시작 시 미리 생성됨(루프 내 makedirs 생략)
     """
     global PROG, IMG_URL_CACHE
 
@@ -800,7 +817,6 @@ def save_and_resize_image(context, img_url: str, brand_key: str, rank: int, refe
     if norm_key in IMG_URL_CACHE and IMG_URL_CACHE[norm_key]:
         return IMG_URL_CACHE[norm_key], "cached"
 
-    os.makedirs(ASSET_DIR, exist_ok=True)
     out_ext = ".jpg" if PIL_OK else guess_ext(img_url)
     fname = safe_filename(f"{brand_key}_{rank}_{sha1(norm_key)}", out_ext)
     out_path = os.path.join(ASSET_DIR, fname)
@@ -901,6 +917,22 @@ def is_closed_error(e: Exception) -> bool:
     msg = str(e).lower()
     return "has been closed" in msg or "target page" in msg or "browser has been closed" in msg
 
+def _route_block_heavy(route) -> None:
+    """font/media/websocket + 트래킹 도메인은 abort, 나머지(document/script/xhr/image/css)는 통과"""
+    try:
+        req = route.request
+        if req.resource_type in BLOCKED_RESOURCE_TYPES or any(tok in req.url for tok in BLOCKED_URL_TOKENS):
+            route.abort()
+        else:
+            route.continue_()
+    except Exception:
+        # 응답 없이 끝난 route는 해당 요청이 navigation timeout까지 멈춰 있으므로 통과로라도 처리.
+        # 이미 처리된 route(abort/continue 후 예외)면 여기서도 실패하니 무시
+        try:
+            route.continue_()
+        except Exception:
+            pass
+
 def launch(pw):
     browser = pw.chromium.launch(headless=HEADLESS)
     context = browser.new_context(
@@ -908,6 +940,12 @@ def launch(pw):
         viewport={"width": 1440, "height": 900},
         locale="ko-KR",
     )
+    # relaunch 시에도 동일하게 적용되도록 launch 안에서 route 설치
+    if BLOCK_HEAVY_RESOURCES:
+        try:
+            context.route("**/*", _route_block_heavy)
+        except Exception:
+            pass
     return browser, context
 
 
@@ -1403,6 +1441,20 @@ def fetch_campaign_page_meta(context, href: str) -> Dict[str, Any]:
 # =====================================================
 # Extractors helpers
 # =====================================================
+# 요소 자신(a) 또는 하위 a[href]의 href를 한 번의 evaluate로 조회 (locator/count/get_attribute 왕복 제거)
+_JS_LINK_HREF = r"""
+e => {
+  const a = e.tagName === 'A' ? e : e.querySelector('a[href]');
+  return a ? (a.getAttribute('href') || '') : '';
+}
+"""
+
+def get_link_href(el) -> str:
+    try:
+        return el.evaluate(_JS_LINK_HREF) or ""
+    except Exception:
+        return ""
+
 def get_any_alt_text(el) -> str:
     try:
         img = el.locator("img").first
@@ -1962,11 +2014,7 @@ def patagonia_static_hero(context, page, base_url: str, brand_key: str, brand_na
                     best_title = ""
                 if not best_title:
                     best_title = get_any_alt_text(el)
-                try:
-                    a = el.locator("a[href]").first
-                    best_href = abs_url(base_url, a.get_attribute("href") or "") if a.count() else ""
-                except Exception:
-                    best_href = ""
+                best_href = abs_url(base_url, get_link_href(el))
                 best_img = img_url
         except Exception:
             continue
@@ -1974,7 +2022,7 @@ def patagonia_static_hero(context, page, base_url: str, brand_key: str, brand_na
     if not best_img:
         return []
 
-    title = choose_title(best_title, urllib.parse.unquote((best_img or "").split("/")[-1]))
+    title = choose_title(best_title, _fname_title(best_img or ""))
     img_local, st = save_and_resize_image(context, best_img, brand_key, 1, referer=base_url)
 
     b = build_banner(date_s, brand_key, brand_name, 1, title, best_href, best_img, img_local, st,
@@ -2161,8 +2209,7 @@ def generic_top_banners(context, page_or_frame, base_url: str, brand_key: str, b
             break
         el = candidates.nth(i)
         try:
-            if not el.is_visible():
-                continue
+            # is_visible() 생략: display:none 이면 bbox=None, 크기 gate가 나머지를 걸러냄 (CDP 왕복 1회 절감)
             bb = el.bounding_box()
             if not bb:
                 continue
@@ -2176,16 +2223,9 @@ def generic_top_banners(context, page_or_frame, base_url: str, brand_key: str, b
             if not img_url:
                 continue
 
-            href = ""
-            try:
-                is_a = el.evaluate("e => e.tagName.toLowerCase()") == "a"
-                a = el if is_a else el.locator("a[href]").first
-                if a and a.count():
-                    href = abs_url(base_url, a.get_attribute("href") or "")
-            except Exception:
-                pass
+            href = abs_url(base_url, get_link_href(el))
 
-            fp = sha1("\n".join([normalize_href(href), normalize_img_url(img_url)]))
+            fp = (normalize_href(href), normalize_img_url(img_url))
             if fp in seen:
                 continue
             seen.add(fp)
@@ -3233,8 +3273,16 @@ def summarize_brand_insight(brand_key: str, items: List[Banner], changes_map: Di
     }
 
 
+_esc = html.escape
+
+
 def _h(v: Any) -> str:
-    return html.escape(str(v or ""))
+    return _esc(str(v or ""))
+
+
+def _js_literal(v: Any) -> str:
+    """<script> 안에 넣을 JSON 리터럴: '</script>' 조기 종료 방지"""
+    return json.dumps(v).replace("</", "<\\/")
 
 
 def _html_pct_chip(pct: float) -> str:
@@ -3482,37 +3530,121 @@ def _banner_status_meta(banner: Banner) -> str:
     return " | ".join(bits)
 
 
-def _render_secondary_card(banner: Banner) -> str:
-    href = _h(banner.href_clean or banner.href or "#")
-    img_url_btn = _h(banner.img_url or _html_img_src(banner) or "#")
-    img_src = _h(_html_img_src(banner))
-    title = _h(_display_title(banner))
-    subtitle = _display_subtitle(banner)
-    summary = _display_summary(banner)
-    chips = "".join([f'<span class="mini-stat">{_h(x)}</span>' for x in _keyword_chip_list(banner)]) or f'<span class="mini-stat">{_h(banner.landing_category or banner.extract_source or "meta 없음")}</span>'
-    return f"""
+# 카드/탭/섹션 HTML 템플릿: 모듈 로드 시 1회 정의, 루프에서는 %-치환만 수행
+_CARD_TPL = """
     <article class="soft-panel overflow-hidden flex flex-col">
       <div class="relative aspect-[16/9] bg-slate-100">
-        <img src="{img_src}" class="w-full h-full object-cover"
+        <img src="%(img_src)s" class="w-full h-full object-cover"
              onerror="this.onerror=null; this.src='https://placehold.co/640x360?text=No+Image';">
-        <span class="rank-chip">RANK {int(banner.rank or 0)}</span>
+        <span class="rank-chip">RANK %(rank)d</span>
       </div>
       <div class="p-5 flex flex-col gap-3 flex-1">
         <div>
-          <div class="text-[11px] font-semibold text-slate-500">{_h(_html_date_txt(banner))}</div>
-          <h4 class="mt-2 text-sm font-bold text-slate-900 clamp-2">"{title}"</h4>
-          <p class="mt-1 text-[12px] text-slate-500 clamp-2">{_h(subtitle or summary)}</p>
-          <div class="mt-3 flex flex-wrap gap-2">{chips}</div>
-          <p class="mt-2 text-[11px] text-slate-500">{_h(_banner_status_meta(banner) or _html_meta_txt(banner))}</p>
+          <div class="text-[11px] font-semibold text-slate-500">%(date_txt)s</div>
+          <h4 class="mt-2 text-sm font-bold text-slate-900 clamp-2">"%(title)s"</h4>
+          <p class="mt-1 text-[12px] text-slate-500 clamp-2">%(subtitle)s</p>
+          <div class="mt-3 flex flex-wrap gap-2">%(chips)s</div>
+          <p class="mt-2 text-[11px] text-slate-500">%(status_meta)s</p>
         </div>
         <div class="mt-auto flex gap-2">
-          <a href="{href}" target="_blank" class="btn-primary flex-1 text-center text-[11px]">기획전 보기</a>
-          <a href="{img_url_btn}" target="_blank" class="btn-secondary text-[11px]">원본 이미지</a>
+          <a href="%(href)s" target="_blank" class="btn-primary flex-1 text-center text-[11px]">기획전 보기</a>
+          <a href="%(img_url_btn)s" target="_blank" class="btn-secondary text-[11px]">원본 이미지</a>
         </div>
       </div>
     </article>
     """
 
+_TAB_TPL = '<button onclick="switchTab(\'%(bk)s\')" id="tab-%(bk)s" class="%(cls)s" data-style="%(style)s" data-origin="%(origin)s"><span class="brand-tab-name">%(name)s</span><span class="tab-meta">%(meta)d</span></button>'
+
+_EMPTY_CONTENT_TPL = '<section id="content-%(bk)s" class="tab-content" style="display:%(display)s"><div class="glass-card p-8 text-slate-500"><div class="text-base font-bold mb-2">No banner data collected yet.</div></div></section>'
+
+_CONTENT_WRAPPER = """
+        <section id="content-%(bk)s" class="tab-content" style="display:%(display)s;">
+          <div class="grid grid-cols-1 xl:grid-cols-3 gap-6">
+            <div class="xl:col-span-2 flex flex-col gap-6">
+              <article class="glass-card overflow-hidden">
+                <div class="grid grid-cols-1 lg:grid-cols-[minmax(0,1.15fr)_minmax(320px,0.85fr)]">
+                  <div class="relative min-h-[320px] bg-slate-100">
+                    <img src="%(top_img_src)s" class="w-full h-full object-cover" onerror="this.onerror=null; this.src='https://placehold.co/1100x620?text=No+Image';">
+                    <div class="absolute inset-0 bg-gradient-to-t from-slate-950/50 via-transparent to-transparent"></div>
+                    <div class="absolute left-5 top-5 flex flex-wrap gap-2">
+                      <span class="inline-flex items-center justify-center rounded-full bg-[rgba(11,43,102,0.9)] px-3 py-2 text-[11px] font-black text-white">RANK %(top_rank)d</span>
+                      <span class="inline-flex items-center justify-center rounded-full bg-white/15 px-3 py-2 text-[11px] font-black text-white">%(seg_style)s</span>
+                      <span class="inline-flex items-center justify-center rounded-full bg-white/15 px-3 py-2 text-[11px] font-black text-white">%(seg_origin)s</span>
+                    </div>
+                  </div>
+                  <div class="p-6 lg:p-7 flex flex-col gap-5">
+                    <div>
+                      <div class="text-xs font-bold uppercase tracking-[0.16em] text-slate-400">Brand Detail</div>
+                      <h3 class="mt-2 brand-hero-name">%(brand_name)s</h3>
+                      <p class="mt-3 text-lg font-bold text-slate-900 clamp-3">"%(top_title)s"</p>
+                      <div class="mt-4 flex flex-wrap gap-2">%(event_chip)s%(changed_chip)s</div>
+                    </div>
+                    <div class="grid grid-cols-2 gap-3">
+                      <div class="mini-card"><span>Events</span><strong>%(events)d</strong></div>
+                      <div class="mini-card"><span>Actual Changes</span><strong>%(changed)d</strong></div>
+                      <div class="mini-card"><span>Campaign Dates</span><strong>%(top_date_txt)s</strong></div>
+                      <div class="mini-card"><span>Image Meta</span><strong>%(top_meta_txt)s</strong></div>
+                    </div>
+                    <div class="flex flex-wrap gap-2">%(visual_badges)s</div>
+                    <div class="flex gap-2 mt-auto">
+                      <a href="%(top_href)s" target="_blank" class="btn-primary flex-1 text-center">Open Landing</a>
+                      <a href="%(top_img_btn)s" target="_blank" class="btn-secondary">Open Image</a>
+                    </div>
+                  </div>
+                </div>
+              </article>
+              <div class="grid grid-cols-1 md:grid-cols-2 gap-5">%(other_cards)s</div>
+            </div>
+            <aside class="flex flex-col gap-5">
+              <section class="glass-card p-6">
+                <div class="text-xs font-bold uppercase tracking-[0.16em] text-slate-400">Brand Insight</div>
+                <h4 class="mt-2 text-xl font-black text-slate-900">%(brand_name)s Summary</h4>
+                <p class="mt-3 text-sm text-slate-600">Weekly theme: %(weekly_theme)s</p>
+                <div class="mt-5 grid grid-cols-2 gap-3">
+                  <div class="mini-card"><span>Added</span><strong>%(added)d</strong></div>
+                  <div class="mini-card"><span>Removed</span><strong>%(removed)d</strong></div>
+                  <div class="mini-card"><span>Segment</span><strong>%(segment_style)s</strong></div>
+                  <div class="mini-card"><span>Origin</span><strong>%(segment_origin)s</strong></div>
+                </div>
+                <div class="mt-5"><div class="panel-label">Keyword Cluster</div><div class="mt-2 flex flex-wrap gap-2">%(keyword_badges)s</div></div>
+                <div class="mt-5"><div class="panel-label">Visual / OCR</div><p class="mt-2 text-sm text-slate-700">%(visual_summary)s</p><div class="mt-2 flex flex-wrap gap-2">%(visual_badges)s</div></div>
+                <div class="mt-5"><div class="panel-label">OCR Text</div><div class="mt-2 rounded-2xl bg-slate-50 px-4 py-3 text-sm text-slate-600">%(ocr_text)s</div></div>
+              </section>
+              <section class="glass-card p-6"><div class="panel-label">Recent Title Changes</div><ul class="mt-3 space-y-2">%(recent_titles)s</ul></section>
+            </aside>
+          </div>
+        </section>
+        """
+
+
+def _build_img_src_map(rows: List[Banner]) -> Dict[int, str]:
+    """id(banner) -> 카드 img src (로컬 asset 있는 배너만). 카드 루프 밖에서 1회 계산"""
+    use_abs = HTML_USE_ABSOLUTE_FILE_URL
+    asset_dir = ASSET_DIR
+    return {
+        id(b): (to_file_url(os.path.join(asset_dir, b.img_local)) if use_abs else f"assets/{b.img_local}")
+        for b in rows if b.img_local
+    }
+
+
+def _render_secondary_card(banner: Banner, img_src: Optional[str] = None) -> str:
+    subtitle = _display_subtitle(banner)
+    chips = "".join([f'<span class="mini-stat">{_h(x)}</span>' for x in _keyword_chip_list(banner)]) or f'<span class="mini-stat">{_h(banner.landing_category or banner.extract_source or "meta 없음")}</span>'
+    if img_src is None:
+        img_src = _html_img_src(banner)
+    return _CARD_TPL % {
+        "img_src": _h(img_src),
+        "rank": int(banner.rank or 0),
+        "date_txt": _h(_html_date_txt(banner)),
+        "title": _h(_display_title(banner)),
+        "subtitle": _h(subtitle or _display_summary(banner)),
+        "chips": chips,
+        "status_meta": _h(_banner_status_meta(banner) or _html_meta_txt(banner)),
+        "href": _h(banner.href_clean or banner.href or "#"),
+        "img_url_btn": _h(banner.img_url or img_src or "#"),
+    }
+
 
 def _render_heatmap_section(changes: Dict[str, Any]) -> str:
     brands = (changes.get("brands") or [])[:10]
@@ -3790,6 +3922,23 @@ def _dashboard_css(day_count: int) -> str:
     }}
     """
 
+def _tailwind_tag() -> str:
+    """TAILWIND_CSS_HREF 지정 시 로컬 css(<link>), 아니면 CDN JIT 런타임"""
+    if TAILWIND_CSS_HREF:
+        return f'<link rel="stylesheet" href="{_h(TAILWIND_CSS_HREF)}">'
+    return '<script src="https://cdn.tailwindcss.com"></script>'
+
+def write_html_file(path: str, full_html: str):
+    """html 저장 + (HTML_WRITE_GZIP) 서빙용 path.gz 사본"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(full_html)
+    if HTML_WRITE_GZIP:
+        try:
+            with gzip.open(path + ".gz", "wt", compresslevel=6, encoding="utf-8") as gz:
+                gz.write(full_html)
+        except Exception:
+            pass
+
 def write_json(path: str, obj: Any):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
@@ -3898,6 +4047,13 @@ def write_html_legacy(path: str, rows: List[Banner], changes: Optional[Dict[str,
                 elif it.img_status and it.img_status != "ok":
                     meta_txt = f"{it.img_status}"
 
+                img_src = _esc(img_src, quote=True)
+                href = _esc(href, quote=True)
+                img_url_btn = _esc(img_url_btn, quote=True)
+                title_e = _esc(it.title or "")
+                date_txt = _esc(date_txt)
+                meta_txt = _esc(meta_txt)
+
                 cards_html += f"""
 <div class="glass-card overflow-hidden hover:scale-[1.02] transition-transform flex flex-col">
   <div class="relative aspect-[16/9] bg-slate-100">
@@ -3908,7 +4064,7 @@ def write_html_legacy(path: str, rows: List[Banner], changes: Optional[Dict[str,
     </span>
   </div>
   <div class="p-6 flex flex-col flex-1">
-    <h4 class="text-slate-800 font-bold text-sm mb-2 line-clamp-2 min-h-[40px]">"{it.title}"</h4>
+    <h4 class="text-slate-800 font-bold text-sm mb-2 line-clamp-2 min-h-[40px]">"{title_e}"</h4>
 
     <div class="text-xs text-slate-500 mb-4">
       <div>{date_txt}</div>
@@ -3937,7 +4093,7 @@ def write_html_legacy(path: str, rows: List[Banner], changes: Optional[Dict[str,
 <head>
   <meta charset="UTF-8">
   <title>M-OS PRO | Competitor Hero Analysis</title>
-  <script src="https://cdn.tailwindcss.com"></script>
+  {_tailwind_tag()}
   <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" rel="stylesheet">
   <style>
     :root {{ --brand: #002d72; --bg0: #f6f8fb; --bg1: #eef3f9; }}
@@ -4284,7 +4440,7 @@ def write_dashboard_html_legacy(path: str, rows: List[Banner], changes: Optional
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>M-OS PRO | Competitor Hero Analysis</title>
-  <script src="https://cdn.tailwindcss.com"></script>
+  {_tailwind_tag()}
   <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" rel="stylesheet">
   <style>{_dashboard_css(len(safe_changes.get("timeline_days") or []))}</style>
 </head>
@@ -4385,6 +4541,7 @@ def write_dashboard_html(path: str, rows: List[Banner], changes: Optional[Dict[s
         for bk in active_brand_keys
     }
     pressure_section_html = _render_competitive_pressure_section(safe_changes, brand_name_map)
+    img_srcs = _build_img_src_map(rows)
 
     overview_cards_html = f"""
     <div class="grid grid-cols-1 md:grid-cols-2 xl:grid-cols-4 gap-4">
@@ -4413,89 +4570,64 @@ def write_dashboard_html(path: str, rows: List[Banner], changes: Optional[Dict[s
         for key, label in [("all", "전체"), ("라이프스타일", "라이프스타일"), ("전문 산행", "전문 산행"), ("글로벌", "글로벌"), ("로컬", "로컬")]
     ])
 
-    tab_menu_html = ""
-    content_area_html = ""
+    tab_parts: List[str] = []
+    content_parts: List[str] = []
     for i, bk in enumerate(active_brand_keys):
         items = sorted(by_brand.get(bk, []), key=lambda x: x.rank)
         brand_name = brand_name_map.get(bk, bk)
         seg = BRAND_SEGMENTS.get(bk, {"style": "ETC", "origin": "ETC"})
         insight = brand_insights.get(bk, {})
-        tab_menu_html += '<button onclick="switchTab(\'{bk}\')" id="tab-{bk}" class="{cls}" data-style="{style}" data-origin="{origin}"><span class="brand-tab-name">{name}</span><span class="tab-meta">{meta}</span></button>'.format(
-            bk=_h(bk),
-            cls=("tab-btn active" if i == 0 else "tab-btn"),
-            style=_h(seg.get("style", "ETC")),
-            origin=_h(seg.get("origin", "ETC")),
-            name=_h(brand_name),
-            meta=int(insight.get("events", 0) or len(items)),
-        )
+        display = "block" if i == 0 else "none"
+        tab_parts.append(_TAB_TPL % {
+            "bk": _h(bk),
+            "cls": ("tab-btn active" if i == 0 else "tab-btn"),
+            "style": _h(seg.get("style", "ETC")),
+            "origin": _h(seg.get("origin", "ETC")),
+            "name": _h(brand_name),
+            "meta": int(insight.get("events", 0) or len(items)),
+        })
         if not items:
-            content_area_html += f'<section id="content-{_h(bk)}" class="tab-content" style="display:{"block" if i == 0 else "none"}"><div class="glass-card p-8 text-slate-500"><div class="text-base font-bold mb-2">No banner data collected yet.</div></div></section>'
+            content_parts.append(_EMPTY_CONTENT_TPL % {"bk": _h(bk), "display": display})
             continue
 
         top_item = items[0]
+        top_img_src = img_srcs.get(id(top_item), top_item.img_url or "")
         visual = insight.get("visual", {}) or {}
         visual_badges = "".join([f'<span class="insight-chip accent">{_h(tag)}</span>' for tag in visual.get("tags", [])[:6]]) or '<span class="text-sm text-slate-400">No tags</span>'
         keyword_badges = "".join([f'<span class="insight-chip">{_h(x.get("keyword", ""))} <em>{int(x.get("count", 0) or 0)}</em></span>' for x in insight.get("keywords", [])[:5]]) or '<span class="text-sm text-slate-400">No keywords</span>'
         recent_titles_html = "".join([f'<li class="insight-list-item">"{_h(t)}"</li>' for t in insight.get("recent_titles", [])[:4]]) or '<li class="insight-list-item">No recent title changes</li>'
-        other_cards = "".join([_render_secondary_card(it) for it in items[1:7]]) or '<div class="soft-panel p-6 text-sm text-slate-500">No additional banner cards.</div>'
-        content_area_html += f"""
-        <section id="content-{_h(bk)}" class="tab-content" style="display:{'block' if i == 0 else 'none'};">
-          <div class="grid grid-cols-1 xl:grid-cols-3 gap-6">
-            <div class="xl:col-span-2 flex flex-col gap-6">
-              <article class="glass-card overflow-hidden">
-                <div class="grid grid-cols-1 lg:grid-cols-[minmax(0,1.15fr)_minmax(320px,0.85fr)]">
-                  <div class="relative min-h-[320px] bg-slate-100">
-                    <img src="{_h(_html_img_src(top_item))}" class="w-full h-full object-cover" onerror="this.onerror=null; this.src='https://placehold.co/1100x620?text=No+Image';">
-                    <div class="absolute inset-0 bg-gradient-to-t from-slate-950/50 via-transparent to-transparent"></div>
-                    <div class="absolute left-5 top-5 flex flex-wrap gap-2">
-                      <span class="inline-flex items-center justify-center rounded-full bg-[rgba(11,43,102,0.9)] px-3 py-2 text-[11px] font-black text-white">RANK {int(top_item.rank or 0)}</span>
-                      <span class="inline-flex items-center justify-center rounded-full bg-white/15 px-3 py-2 text-[11px] font-black text-white">{_h(seg.get('style', 'ETC'))}</span>
-                      <span class="inline-flex items-center justify-center rounded-full bg-white/15 px-3 py-2 text-[11px] font-black text-white">{_h(seg.get('origin', 'ETC'))}</span>
-                    </div>
-                  </div>
-                  <div class="p-6 lg:p-7 flex flex-col gap-5">
-                    <div>
-                      <div class="text-xs font-bold uppercase tracking-[0.16em] text-slate-400">Brand Detail</div>
-                      <h3 class="mt-2 brand-hero-name">{_h(brand_name)}</h3>
-                      <p class="mt-3 text-lg font-bold text-slate-900 clamp-3">"{_h(top_item.title or '-')}"</p>
-                      <div class="mt-4 flex flex-wrap gap-2">{_html_pct_chip(float(insight.get('event_delta_pct', 0.0) or 0.0))}{_html_pct_chip(float(insight.get('changed_delta_pct', 0.0) or 0.0))}</div>
-                    </div>
-                    <div class="grid grid-cols-2 gap-3">
-                      <div class="mini-card"><span>Events</span><strong>{int(insight.get('events', 0) or 0)}</strong></div>
-                      <div class="mini-card"><span>Actual Changes</span><strong>{int(insight.get('changed', 0) or 0)}</strong></div>
-                      <div class="mini-card"><span>Campaign Dates</span><strong>{_h(_html_date_txt(top_item))}</strong></div>
-                      <div class="mini-card"><span>Image Meta</span><strong>{_h(_html_meta_txt(top_item))}</strong></div>
-                    </div>
-                    <div class="flex flex-wrap gap-2">{visual_badges}</div>
-                    <div class="flex gap-2 mt-auto">
-                      <a href="{_h(top_item.href_clean or top_item.href or '#')}" target="_blank" class="btn-primary flex-1 text-center">Open Landing</a>
-                      <a href="{_h(top_item.img_url or _html_img_src(top_item) or '#')}" target="_blank" class="btn-secondary">Open Image</a>
-                    </div>
-                  </div>
-                </div>
-              </article>
-              <div class="grid grid-cols-1 md:grid-cols-2 gap-5">{other_cards}</div>
-            </div>
-            <aside class="flex flex-col gap-5">
-              <section class="glass-card p-6">
-                <div class="text-xs font-bold uppercase tracking-[0.16em] text-slate-400">Brand Insight</div>
-                <h4 class="mt-2 text-xl font-black text-slate-900">{_h(brand_name)} Summary</h4>
-                <p class="mt-3 text-sm text-slate-600">Weekly theme: {_h(', '.join([x.get('keyword', '') for x in insight.get('keywords', [])[:3]]) or 'No keyword summary')}</p>
-                <div class="mt-5 grid grid-cols-2 gap-3">
-                  <div class="mini-card"><span>Added</span><strong>{int(insight.get('added', 0) or 0)}</strong></div>
-                  <div class="mini-card"><span>Removed</span><strong>{int(insight.get('removed', 0) or 0)}</strong></div>
-                  <div class="mini-card"><span>Segment</span><strong>{_h(insight.get('segment_style', 'ETC'))}</strong></div>
-                  <div class="mini-card"><span>Origin</span><strong>{_h(insight.get('segment_origin', 'ETC'))}</strong></div>
-                </div>
-                <div class="mt-5"><div class="panel-label">Keyword Cluster</div><div class="mt-2 flex flex-wrap gap-2">{keyword_badges}</div></div>
-                <div class="mt-5"><div class="panel-label">Visual / OCR</div><p class="mt-2 text-sm text-slate-700">{_h(visual.get('summary', 'No visual summary'))}</p><div class="mt-2 flex flex-wrap gap-2">{visual_badges}</div></div>
-                <div class="mt-5"><div class="panel-label">OCR Text</div><div class="mt-2 rounded-2xl bg-slate-50 px-4 py-3 text-sm text-slate-600">{_h(visual.get('ocr_text', '') or 'OCR disabled or no text')}</div></div>
-              </section>
-              <section class="glass-card p-6"><div class="panel-label">Recent Title Changes</div><ul class="mt-3 space-y-2">{recent_titles_html}</ul></section>
-            </aside>
-          </div>
-        </section>
-        """
+        other_cards = "".join([_render_secondary_card(it, img_srcs.get(id(it), it.img_url or "")) for it in items[1:7]]) or '<div class="soft-panel p-6 text-sm text-slate-500">No additional banner cards.</div>'
+        content_parts.append(_CONTENT_WRAPPER % {
+            "bk": _h(bk),
+            "display": display,
+            "top_img_src": _h(top_img_src),
+            "top_rank": int(top_item.rank or 0),
+            "seg_style": _h(seg.get("style", "ETC")),
+            "seg_origin": _h(seg.get("origin", "ETC")),
+            "brand_name": _h(brand_name),
+            "top_title": _h(top_item.title or "-"),
+            "event_chip": _html_pct_chip(float(insight.get("event_delta_pct", 0.0) or 0.0)),
+            "changed_chip": _html_pct_chip(float(insight.get("changed_delta_pct", 0.0) or 0.0)),
+            "events": int(insight.get("events", 0) or 0),
+            "changed": int(insight.get("changed", 0) or 0),
+            "top_date_txt": _h(_html_date_txt(top_item)),
+            "top_meta_txt": _h(_html_meta_txt(top_item)),
+            "visual_badges": visual_badges,
+            "top_href": _h(top_item.href_clean or top_item.href or "#"),
+            "top_img_btn": _h(top_item.img_url or top_img_src or "#"),
+            "other_cards": other_cards,
+            "weekly_theme": _h(", ".join([x.get("keyword", "") for x in insight.get("keywords", [])[:3]]) or "No keyword summary"),
+            "added": int(insight.get("added", 0) or 0),
+            "removed": int(insight.get("removed", 0) or 0),
+            "segment_style": _h(insight.get("segment_style", "ETC")),
+            "segment_origin": _h(insight.get("segment_origin", "ETC")),
+            "keyword_badges": keyword_badges,
+            "visual_summary": _h(visual.get("summary", "No visual summary")),
+            "ocr_text": _h(visual.get("ocr_text", "") or "OCR disabled or no text"),
+            "recent_titles": recent_titles_html,
+        })
+    tab_menu_html = "".join(tab_parts)
+    content_area_html = "".join(content_parts)
 
     full_html = f"""
 <!DOCTYPE html>
@@ -4504,7 +4636,7 @@ def write_dashboard_html(path: str, rows: List[Banner], changes: Optional[Dict[s
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>M-OS PRO | Competitor Hero Analysis</title>
-  <script src="https://cdn.tailwindcss.com"></script>
+  {_tailwind_tag()}
   <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" rel="stylesheet">
   <style>{_dashboard_css(len(safe_changes.get("timeline_days") or []))}</style>
 </head>
@@ -4558,7 +4690,7 @@ def write_dashboard_html(path: str, rows: List[Banner], changes: Optional[Dict[s
           main.insertBefore(brandSection, analyticsSection);
         }}
         const analyticsSide = analyticsSection && analyticsSection.children.length > 1 ? analyticsSection.children[1] : null;
-        const pressureHtml = {json.dumps(pressure_section_html)};
+        const pressureHtml = {_js_literal(pressure_section_html)};
         if (analyticsSide && pressureHtml && !analyticsSide.querySelector('.pressure-row')) {{
           analyticsSide.insertAdjacentHTML('beforeend', pressureHtml);
         }}
@@ -4615,8 +4747,7 @@ def write_dashboard_html(path: str, rows: List[Banner], changes: Optional[Dict[s
 </html>
 """
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(full_html)
+    write_html_file(path, full_html)
 
 
 # =====================================================
@@ -4886,9 +5017,15 @@ def main():
 
         # write outputs
         with stage("OUTPUT", "write_csv/html/diff"):
-            write_csv(today_snap, rows)
-            write_csv(report_csv, rows)
-
+            # CSV 2건은 워커 스레드에서 쓰고, 그 동안 메인 스레드에서 브라우저 종료(sync API는 스레드 비안전)
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                futs = [ex.submit(write_csv, today_snap, rows), ex.submit(write_csv, report_csv, rows)]
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+                for fut in futs:
+                    fut.result()
 
             prev_csv = _latest_prev_snapshot(date_s)
             daily_changes = {}
@@ -4972,11 +5109,6 @@ def main():
         print(f"[FETCH_CAMPAIGN_META] {FETCH_CAMPAIGN_META} (rank_limit={CAMPAIGN_META_RANK_LIMIT})", flush=True)
         print(f"[ALERT_NOTIFY] slack={slack_status} email={email_status}", flush=True)
 
-        try:
-            browser.close()
-        except Exception:
-            pass
-
     if not os.path.exists(report_html):
         print(f"[FATAL] HTML not created: {report_html}", flush=True)
         sys.exit(1)
@@ -36,9 +36,14 @@
 
 import os
 import re
+import math
 import time
+import heapq
+import functools
 import json
 import glob
+import sqlite3
+import asyncio
 import argparse
 import urllib.parse
 import urllib.request
@@ -92,6 +97,59 @@ try:
 except Exception:
     Image = None
 
+# orjson (JSON 직렬화 가속, 미설치 시 표준 json)
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# pyarrow (관리용 CSV 고속 로드, 미설치 시 pandas 기본 엔진)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except Exception:
+    pa = None
+    pa_csv = None
+
+# aiohttp (네이버 API 동시 호출용, 미설치 시 순차 호출)
+try:
+    import aiohttp
+except Exception:
+    aiohttp = None
+
+
+# -----------------------------
+# JSON 헬퍼 (orjson 우선)
+# -----------------------------
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_finite(obj: Any) -> Any:
+    """NaN/inf float를 None으로 (orjson은 null로 쓰지만 표준 json은 bare NaN을 씀)"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _json_finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_finite(v) for v in obj]
+    return obj
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(_json_finite(obj), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+
+def _json_dumps(obj: Any) -> str:
+    return _json_dumps_bytes(obj).decode("utf-8")
+
 
 # -----------------------------
 # 공통 로깅
@@ -148,17 +206,23 @@ def pick_input_file(
 # -----------------------------
 API_URL = "https://openapi.naver.com/v1/search/shop.json"
 
+# 반복 호출되는 정규식 (미리 컴파일)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_NONDIGIT_RE = re.compile(r"[^\d]")
+_SAFE_CODE_RE = re.compile(r"[^A-Za-z0-9_\-]")
+_RESULT_FN_RE = re.compile(r"result_(\d{4})\.csv$", re.IGNORECASE)
+
 
 def strip_html_tags(s: str) -> str:
     if not s:
         return ""
-    return re.sub(r"<[^>]+>", "", s)
+    return _HTML_TAG_RE.sub("", s)
 
 
 def _to_int_price(x) -> Optional[int]:
     if pd.isna(x):
         return None
-    s = re.sub(r"[^\d]", "", str(x))
+    s = _NONDIGIT_RE.sub("", str(x))
     return int(s) if s else None
 
 
@@ -188,7 +252,7 @@ def fetch_naver_shop_with_retry(
 
         try:
             with urllib.request.urlopen(req, timeout=timeout_sec) as res:
-                payload = json.loads(res.read().decode("utf-8"))
+                payload = _json_loads(res.read())
                 return payload.get("items", []) or []
 
         except urllib.error.HTTPError as e:
@@ -207,86 +271,202 @@ def fetch_naver_shop_with_retry(
     return []
 
 
-def filter_items_for_accuracy(
+async def fetch_naver_shop_async(
+    session: "aiohttp.ClientSession",
+    sem: asyncio.Semaphore,
+    query: str,
+    client_id: str,
+    client_secret: str,
+    display: int = 10,
+    max_retries: int = 4,
+    base_sleep: float = 0.6,
+    delay: float = 0.0,
+) -> List[Dict[str, Any]]:
+    """fetch_naver_shop_with_retry의 async 버전 (sem으로 동시 호출 수 제한, 429/5xx는 backoff 재시도)"""
+    enc = urllib.parse.quote(query)
+    url = f"{API_URL}?query={enc}&display={display}&start=1"
+    headers = {"X-Naver-Client-Id": client_id, "X-Naver-Client-Secret": client_secret}
+
+    for attempt in range(max_retries + 1):
+        status: Optional[int] = None
+        try:
+            async with sem:
+                async with session.get(url, headers=headers) as res:
+                    status = res.status
+                    if status == 200:
+                        payload = await res.json(loads=_json_loads, content_type=None)
+                        items = payload.get("items", []) or []
+                    else:
+                        items = None
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if items is not None:
+                return items
+        except Exception:
+            status = None
+
+        retryable = status is None or status == 429 or status >= 500
+        if attempt < max_retries and retryable:
+            await asyncio.sleep(base_sleep * (2 ** attempt))
+            continue
+        return []
+
+    return []
+
+
+async def _gather_naver_shop(
+    queries: List[Tuple[str, str]],
+    client_id: str,
+    client_secret: str,
+    display: int,
+    max_concurrency: int,
+    delay: float,
+) -> List[Tuple[str, List[Dict[str, Any]]]]:
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+    timeout = aiohttp.ClientTimeout(total=15)
+    # 배치 전체가 세션 하나를 공유 → openapi.naver.com TLS 연결/DNS 결과 재사용
+    connector = aiohttp.TCPConnector(limit=max(1, max_concurrency), ttl_dns_cache=300, keepalive_timeout=30)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        results = await asyncio.gather(*[
+            fetch_naver_shop_async(session, sem, q, client_id, client_secret, display=display, delay=delay)
+            for _, q in queries
+        ])
+    return [(key, items) for (key, _), items in zip(queries, results)]
+
+
+def fetch_naver_shop_batch(
+    queries: List[Tuple[str, str]],
+    client_id: str,
+    client_secret: str,
+    display: int = 10,
+    max_concurrency: int = 8,
+    delay: float = 0.0,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    [(style_code, query)] -> {style_code: items}
+    - 정규화(공백/대소문자) 기준 같은 쿼리는 한 번만 호출하고 결과를 style_code별로 분배
+    - aiohttp 있으면 asyncio.gather로 동시 호출(max_concurrency 제한)
+    - 없으면 fetch_naver_shop_with_retry 순차 호출
+    """
+    if not queries:
+        return {}
+
+    keys_by_query: Dict[str, List[str]] = {}
+    unique: List[Tuple[str, str]] = []
+    for key, q in queries:
+        nq = " ".join(q.split()).lower()
+        if nq not in keys_by_query:
+            keys_by_query[nq] = []
+            unique.append((nq, q))
+        keys_by_query[nq].append(key)
+    if len(unique) < len(queries):
+        log(f"    🔁 QUERY DEDUP: {len(queries):,} -> {len(unique):,}")
+
+    if aiohttp is None:
+        by_query: Dict[str, List[Dict[str, Any]]] = {}
+        for nq, q in unique:
+            by_query[nq] = fetch_naver_shop_with_retry(q, client_id, client_secret, display=display)
+            time.sleep(max(0.0, delay))
+    else:
+        by_query = dict(asyncio.run(_gather_naver_shop(unique, client_id, client_secret, display, max_concurrency, delay)))
+
+    return {key: items for nq, items in by_query.items() for key in keys_by_query[nq]}
+
+
+# 무관 상품/모델컷 키워드 (title 소문자 기준)
+_BAD_TERMS_RE = re.compile("|".join(map(re.escape, [
+    "호환", "케이스", "필름", "스티커", "리필", "커버",
+    "브라", "브래지어", "이너", "나시", "탑", "레깅스", "요가", "스포츠브라",
+    "속옷", "언더웨어", "비키니", "수영복",
+])))
+
+
+# 브랜드명 / 신뢰 몰 키워드 (소문자 기준)
+_COLUMBIA_RE = re.compile("columbia|컬럼비아")
+_TRUST_RE = re.compile("공식|브랜드|백화점|현대|롯데|신세계|네이버|스마트스토어")
+
+
+@functools.lru_cache(maxsize=32)
+def _exclude_malls_re(lowered_excludes: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    if not lowered_excludes:
+        return None
+    return re.compile("|".join(map(re.escape, lowered_excludes)))
+
+
+def process_items(
     items: List[Dict[str, Any]],
     style_code: str,
     min_price: Optional[int],
     max_price: Optional[int],
     exclude_malls: List[str],
-) -> List[Dict[str, Any]]:
+    top_n: int = 3,
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], List[Dict[str, Any]]]:
     """
-    ✅ 정확도 강화 (무관 상품/여자 모델컷 방지)
+    ✅ 정확도 강화 (무관 상품/여자 모델컷 방지) + 최저가/TopN 선정을 한 번에
     - 0) 기본 컷: 가격 범위/몰 제외/악성 키워드
     - 1) 1차: title에 style_code 포함인 결과만
     - 2) 2차: title에 Columbia/컬럼비아 포함인 결과만
     - 3) ❌ fallback 금지: 위 조건 둘 다 실패면 [] 반환
+    - 반환: (filtered, best, top_n) — best/top_n은 lprice 오름차순(동가는 원래 순서)
     """
     if not items:
-        return []
+        return [], None, []
 
     code_l = (style_code or "").strip().lower()
-    lowered_excludes = [e.strip().lower() for e in exclude_malls if e.strip()]
-    cleaned: List[Dict[str, Any]] = []
+    exclude_re = _exclude_malls_re(tuple(e.strip().lower() for e in exclude_malls if e.strip()))
 
-    bad_terms = [
-        "호환", "케이스", "필름", "스티커", "리필", "커버",
-        "브라", "브래지어", "이너", "나시", "탑", "레깅스", "요가", "스포츠브라",
-        "속옷", "언더웨어", "비키니", "수영복",
-    ]
+    # tier별 통과 목록 + 크기 top_n 힙(최대힙: (-lp, -seq, item))
+    code_matched: List[Dict[str, Any]] = []
+    brand_matched: List[Dict[str, Any]] = []
+    code_heap: List[Tuple[int, int, Dict[str, Any]]] = []
+    brand_heap: List[Tuple[int, int, Dict[str, Any]]] = []
 
-    for it in items:
-        lp = _to_int_safe(it.get("lprice"), default=-1)
+    for seq, it in enumerate(items):
+        lp = _to_int_safe(it.get("lprice"), default=None)
+        lp_cut = -1 if lp is None else lp
         mall = (it.get("mallName") or "").strip().lower()
         title = strip_html_tags(it.get("title") or "").lower()
 
-        if min_price is not None and lp < min_price:
+        if min_price is not None and lp_cut < min_price:
             continue
-        if max_price is not None and lp > max_price:
+        if max_price is not None and lp_cut > max_price:
             continue
-        if lowered_excludes and any(ex in mall for ex in lowered_excludes):
+        if exclude_re is not None and exclude_re.search(mall):
             continue
-        if any(t in title for t in bad_terms):
+        if _BAD_TERMS_RE.search(title):
             continue
 
-        cleaned.append(it)
-
-    if not cleaned:
-        return []
-
-    if code_l:
-        code_matched = [it for it in cleaned if code_l in strip_html_tags(it.get("title") or "").lower()]
-        if code_matched:
-            return code_matched
-
-    brand_matched = []
-    for it in cleaned:
-        title = strip_html_tags(it.get("title") or "").lower()
-        if ("columbia" in title) or ("컬럼비아" in title):
+        entry = (-(10**18 if lp is None else lp), -seq, it)
+        if code_l and code_l in title:
+            code_matched.append(it)
+            heapq.heappush(code_heap, entry)
+            if len(code_heap) > top_n:
+                heapq.heappop(code_heap)
+        if _COLUMBIA_RE.search(title):
             brand_matched.append(it)
-    if brand_matched:
-        return brand_matched
-
-    return []
-
-
-def pick_lowest_item(items: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    if not items:
-        return None
-
-    def lp(it: Dict[str, Any]) -> int:
-        return _to_int_safe(it.get("lprice"), default=10**18)
-
-    return min(items, key=lp)
+            heapq.heappush(brand_heap, entry)
+            if len(brand_heap) > top_n:
+                heapq.heappop(brand_heap)
+
+    if code_matched:
+        filtered, heap = code_matched, code_heap
+    elif brand_matched:
+        filtered, heap = brand_matched, brand_heap
+    else:
+        return [], None, []
 
+    top = [e[2] for e in sorted(heap, reverse=True)]
+    return filtered, (top[0] if top else None), top
 
-def pick_top_n_by_price(items: List[Dict[str, Any]], n: int = 3) -> List[Dict[str, Any]]:
-    if not items:
-        return []
 
-    def lp(it: Dict[str, Any]) -> int:
-        return _to_int_safe(it.get("lprice"), default=10**18)
-
-    return sorted(items, key=lp)[:n]
+def filter_items_for_accuracy(
+    items: List[Dict[str, Any]],
+    style_code: str,
+    min_price: Optional[int],
+    max_price: Optional[int],
+    exclude_malls: List[str],
+) -> List[Dict[str, Any]]:
+    return process_items(items, style_code, min_price, max_price, exclude_malls)[0]
 
 
 def compute_confidence(style_code: str, best_item: Optional[Dict[str, Any]]) -> int:
@@ -300,11 +480,9 @@ def compute_confidence(style_code: str, best_item: Optional[Dict[str, Any]]) ->
     score = 0
     if code_l and code_l in title:
         score += 2
-    if "columbia" in title or "컬럼비아" in title:
+    if _COLUMBIA_RE.search(title):
         score += 1
-
-    trust_mall_terms = ["공식", "브랜드", "백화점", "현대", "롯데", "신세계", "네이버", "스마트스토어"]
-    if any(t in mall for t in trust_mall_terms):
+    if _TRUST_RE.search(mall):
         score += 1
 
     return max(0, score)
@@ -323,28 +501,34 @@ def choose_best_image(best_item: Optional[Dict[str, Any]], top_items: List[Dict[
 
 
 # -----------------------------
-# API 캐시
+# API 캐시 (cache_dir/cache.sqlite 단일 DB)
 # -----------------------------
-def cache_path(cache_dir: str, style_code: str) -> str:
-    safe = re.sub(r"[^A-Za-z0-9_\-]", "_", style_code.strip())
-    return os.path.join(cache_dir, f"{safe}.json")
+CACHE_DB_NAME = "cache.sqlite"
 
 
-def load_cache(cache_dir: str, style_code: str, ttl_hours: int = 12) -> Optional[List[Dict[str, Any]]]:
-    path = cache_path(cache_dir, style_code)
-    if not os.path.exists(path):
-        return None
+def open_cache_db(cache_dir: str) -> sqlite3.Connection:
+    os.makedirs(cache_dir, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(cache_dir, CACHE_DB_NAME))
+    conn.execute("CREATE TABLE IF NOT EXISTS cache(code TEXT PRIMARY KEY, items BLOB, saved_at REAL)")
+    return conn
 
+
+def load_cache(
+    conn: sqlite3.Connection,
+    style_code: str,
+    ttl_hours: int = 12,
+    now: Optional[float] = None,
+) -> Optional[List[Dict[str, Any]]]:
     try:
-        mtime = os.path.getmtime(path)
-        age_sec = time.time() - mtime
-        if age_sec > ttl_hours * 3600:
+        row = conn.execute("SELECT items, saved_at FROM cache WHERE code=?", (style_code.strip(),)).fetchone()
+        if not row:
             return None
 
-        with open(path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
+        items_blob, saved_at = row
+        if (now if now is not None else time.time()) - float(saved_at or 0) > ttl_hours * 3600:
+            return None
 
-        items = payload.get("items")
+        items = _json_loads(items_blob)
         if isinstance(items, list):
             return items
         return None
@@ -352,12 +536,20 @@ def load_cache(cache_dir: str, style_code: str, ttl_hours: int = 12) -> Optional
         return None
 
 
-def save_cache(cache_dir: str, style_code: str, items: List[Dict[str, Any]]) -> None:
-    os.makedirs(cache_dir, exist_ok=True)
-    path = cache_path(cache_dir, style_code)
+def save_cache_many(
+    conn: sqlite3.Connection,
+    entries: List[Tuple[str, List[Dict[str, Any]]]],
+    saved_at: float,
+) -> None:
+    """(style_code, items) 목록을 한 트랜잭션으로 upsert (saved_at: epoch 초, 호출부에서 한 번 계산)"""
+    if not entries:
+        return
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump({"items": items, "saved_at": datetime.now().isoformat()}, f, ensure_ascii=False)
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache(code, items, saved_at) VALUES (?, ?, ?)",
+                [(code.strip(), _json_dumps_bytes(items), saved_at) for code, items in entries],
+            )
     except Exception:
         pass
 
@@ -457,6 +649,7 @@ def trim_image_to_local(
     file_stem: str,
     referer: Optional[str] = None,
     ttl_hours: int = 72,
+    now: Optional[float] = None,
 ) -> Tuple[str, Optional[str]]:
     """
     image_url -> 로컬 파일 저장(여백 트리밍) -> file:// 절대경로 반환
@@ -472,7 +665,7 @@ def trim_image_to_local(
     out_png = os.path.join(out_dir, f"{file_stem}.png")
 
     if os.path.exists(out_png):
-        age_sec = time.time() - os.path.getmtime(out_png)
+        age_sec = (now if now is not None else time.time()) - os.path.getmtime(out_png)
         if age_sec <= ttl_hours * 3600:
             return _file_url(os.path.abspath(out_png)), os.path.abspath(out_png)
 
@@ -502,6 +695,45 @@ def trim_image_to_local(
         return image_url, None
 
 
+# -----------------------------
+# 관리용 CSV 로드 (dtype 고정 + pyarrow 엔진 우선)
+# -----------------------------
+def _read_csv_typed(path: str, dtype: Dict[str, str]) -> pd.DataFrame:
+    """dtype에 지정한 컬럼만 타입 추론 없이 읽기. pyarrow 미설치/실패 시 기본 엔진으로 재시도
+
+    pandas의 engine="pyarrow"는 추론으로 파싱한 뒤 dtype을 적용하므로(aHash64 "0" → "0.0")
+    pyarrow.csv에 컬럼 타입을 문자열로 직접 지정해 읽는다.
+    """
+    try:
+        header = pd.read_csv(path, encoding="utf-8-sig", nrows=0).columns
+    except Exception:
+        header = pd.read_csv(path, nrows=0).columns
+
+    cols = [c for c in dtype if c in header]
+    if not cols:
+        return pd.DataFrame(columns=list(header))
+    kw = {"dtype": {c: dtype[c] for c in cols}, "usecols": cols}
+
+    if pa_csv is not None:
+        try:
+            tbl = pa_csv.read_csv(
+                path,
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=cols,
+                    column_types={c: pa.string() for c in cols},
+                    strings_can_be_null=True,
+                ),
+            )
+            return tbl.to_pandas().astype(kw["dtype"])
+        except Exception:
+            pass
+    try:
+        return pd.read_csv(path, encoding="utf-8-sig", **kw)
+    except Exception:
+        return pd.read_csv(path, **kw)
+
+
 # -----------------------------
 # 전일(이전 result_*.csv) 탐색 및 Δ 계산
 # -----------------------------
@@ -510,51 +742,56 @@ def find_previous_result_csv(history_dir: str, today_mmdd: str) -> Optional[str]
         return None
 
     candidates = []
-    for fn in os.listdir(history_dir):
-        if not fn.lower().startswith("result_") or not fn.lower().endswith(".csv"):
-            continue
-        m = re.match(r"result_(\d{4})\.csv$", fn, re.IGNORECASE)
-        if not m:
-            continue
-        mmdd = m.group(1)
-        if mmdd == today_mmdd:
-            continue
-
-        path = os.path.join(history_dir, fn)
-        try:
-            mtime = os.path.getmtime(path)
-        except Exception:
-            mtime = 0
-        candidates.append((mtime, path))
+    with os.scandir(history_dir) as it:
+        for e in it:
+            m = _RESULT_FN_RE.match(e.name)
+            if not m or m.group(1) == today_mmdd:
+                continue
+            try:
+                mtime = e.stat().st_mtime
+            except Exception:
+                mtime = 0
+            candidates.append((mtime, e.path))
 
     if not candidates:
         return None
 
-    candidates.sort(key=lambda x: x[0], reverse=True)
-    return candidates[0][1]
+    # 가장 최근 수정 파일 (동률이면 먼저 나온 항목)
+    return max(candidates, key=lambda x: x[0])[1]
+
+
+def _parquet_sibling(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".parquet"
 
 
 def load_previous_prices(prev_csv_path: str) -> Dict[str, Dict[str, Optional[int]]]:
+    # 같은 이름의 .parquet이 CSV보다 최신이면 우선 사용 (실패 시 CSV)
+    df = None
+    pq_path = _parquet_sibling(prev_csv_path)
     try:
-        df = pd.read_csv(prev_csv_path, encoding="utf-8-sig")
+        if os.path.getmtime(pq_path) >= os.path.getmtime(prev_csv_path):
+            df = pd.read_parquet(pq_path, columns=["코드", "네이버최저가"])
     except Exception:
-        df = pd.read_csv(prev_csv_path)
+        df = None
+    if df is None:
+        df = _read_csv_typed(prev_csv_path, {"코드": "string", "네이버최저가": "string"})
 
-    def to_int_or_none(v):
-        if v is None or (isinstance(v, float) and pd.isna(v)):
-            return None
-        try:
-            return int(float(v))
-        except Exception:
-            return None
+    if "코드" not in df.columns:
+        return {}
 
-    prev: Dict[str, Dict[str, Optional[int]]] = {}
-    for _, r in df.iterrows():
-        code = str(r.get("코드", "")).strip()
-        if not code:
-            continue
-        prev[code] = {"prev_naver": to_int_or_none(r.get("네이버최저가"))}
-    return prev
+    # 행 단위 루프 대신 컬럼 단위로 변환
+    codes = df["코드"].dropna().astype(str).str.strip()
+    if "네이버최저가" in df.columns:
+        prices = pd.to_numeric(df.loc[codes.index, "네이버최저가"], errors="coerce")
+        prices = prices.where(prices.abs() != float("inf"))
+    else:
+        prices = pd.Series(float("nan"), index=codes.index)
+
+    mask = (codes != "").to_numpy()
+    return {
+        c: {"prev_naver": None if pd.isna(v) else int(v)}
+        for c, v in zip(codes.to_numpy()[mask], prices.to_numpy()[mask])
+    }
 
 
 # -----------------------------
@@ -584,62 +821,54 @@ def get_row_value(row: pd.Series, col: Optional[str], fallback_idx: Optional[int
 # -----------------------------
 # official_hashes.csv → code -> image_url 매핑
 # -----------------------------
+# 공식몰 상품 이미지 판별: /data/ProductImages/ 포함 + 노이즈(아이콘/배너) 미포함을 한 번에
+_OFFICIAL_PRODUCT_IMG_RE = re.compile(
+    r"^(?!.*(?:/images/pc/common/ico_|/data/banner/|gift_banner|icon)).*/data/ProductImages/",
+    re.I | re.S,
+)
+
+# "image_url\nproduct_name" 에서 코드 추출
+# - 1순위: URL 파일명(/C12AB1234567.jpg, 대소문자 무시)
+# - 2순위: 상품명 괄호 "(C12AB1234567)" (대문자만)
+_OFFICIAL_CODE_RE = re.compile(
+    r"/((?i:[A-Z]\d{2}[A-Z]{2}\d{7}))\.(?i:jpg|jpeg|png|webp)(?:\?|\n)"
+    r"|\n(?s:.*?)\(([A-Z]\d{2}[A-Z]{2}\d{7})\)"
+)
+
+
 def build_official_image_map(csv_path: str) -> Dict[str, str]:
     if not csv_path or not os.path.exists(csv_path):
         log(f"🖼️ official_hashes not found: {csv_path}")
         return {}
 
     log(f"🖼️ Loading official_hashes: {csv_path}")
-    try:
-        oh = pd.read_csv(csv_path, encoding="utf-8-sig")
-    except Exception:
-        oh = pd.read_csv(csv_path)
+    oh = _read_csv_typed(csv_path, {"product_name": "string", "image_url": "string", "aHash64": "string"})
 
     need_cols = {"product_name", "image_url"}
     if not need_cols.issubset(set(oh.columns)):
         log(f"🖼️ official_hashes columns missing. found={list(oh.columns)}")
         return {}
 
-    img = oh["image_url"].astype(str)
-    bad = (
-        img.str.contains("/images/pc/common/ico_", case=False, na=False)
-        | img.str.contains("/data/banner/", case=False, na=False)
-        | img.str.contains("gift_banner", case=False, na=False)
-        | img.str.contains("icon", case=False, na=False)
-    )
-    oh = oh[~bad].copy()
-
-    img = oh["image_url"].astype(str)
-    is_product = img.str.contains("/data/ProductImages/", case=False, na=False)
-    oh_prod = oh[is_product].copy()
+    # 중간 .copy() 없이 마스크 하나로 필요한 행만 선택
+    is_product = oh["image_url"].astype(str).str.contains(_OFFICIAL_PRODUCT_IMG_RE, na=False)
+    oh_prod = oh.loc[is_product]
 
     if len(oh_prod) == 0:
         log("🖼️ official_hashes: ProductImages rows not found (map empty)")
         return {}
 
-    oh_prod["code"] = (
-        oh_prod["image_url"]
-        .astype(str)
-        .str.extract(r"/([A-Z]\d{2}[A-Z]{2}\d{7})\.(?:jpg|jpeg|png|webp)(?:\?|$)", flags=re.I)[0]
-        .str.upper()
-    )
-
-    miss = oh_prod["code"].isna()
-    if miss.any():
-        oh_prod.loc[miss, "code"] = (
-            oh_prod.loc[miss, "product_name"]
-            .astype(str)
-            .str.extract(r"\(([A-Z]\d{2}[A-Z]{2}\d{7})\)")[0]
-            .str.upper()
-        )
-
-    oh_prod = oh_prod.dropna(subset=["code"]).copy()
+    # URL/상품명 한 번에 추출 후 URL 코드 우선으로 병합
+    # 결측이 하나라도 있으면 concat 전체가 NA가 되므로 양쪽 모두 빈 문자열로 채운다
+    src = oh_prod["image_url"].fillna("").astype(str) + "\n" + oh_prod["product_name"].fillna("").astype(str)
+    ext = src.str.extract(_OFFICIAL_CODE_RE)
+    oh_prod = oh_prod.assign(code=ext[0].fillna(ext[1]).str.upper()).dropna(subset=["code"])
 
     if "aHash64" in oh_prod.columns:
         ah = oh_prod["aHash64"].astype(str).fillna("")
         oh_prod = oh_prod[(ah != "") & (ah != "0")]
 
-    oh_prod = oh_prod.sort_values(["code"]).drop_duplicates("code", keep="first")
+    # 코드별 파일 순서상 첫 행 (정렬 불필요)
+    oh_prod = oh_prod.drop_duplicates("code", keep="first")
     mp = dict(zip(oh_prod["code"], oh_prod["image_url"].astype(str)))
 
     log(f"🖼️ official image map built: {len(mp):,} codes")
@@ -649,17 +878,13 @@ def build_official_image_map(csv_path: str) -> Dict[str, str]:
 # -----------------------------
 # HTML 생성
 # -----------------------------
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", '"': "&quot;", "'": "&#39;", "<": "&lt;", ">": "&gt;"})
+
+
 def _safe_attr(s: str) -> str:
     if s is None:
         return ""
-    return (
-        str(s)
-        .replace("&", "&amp;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-    )
+    return str(s).translate(_HTML_ESCAPE_TABLE)
 
 
 def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
@@ -692,244 +917,263 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
 
     top_gap = sorted(rows, key=gap_abs, reverse=True)[:10]
     top_gap_codes = [str(r.get("코드", "")).strip() for r in top_gap if str(r.get("코드", "")).strip()]
-    top_gap_codes_json = json.dumps(top_gap_codes, ensure_ascii=False)
+    top_gap_codes_json = _json_dumps(top_gap_codes).replace("</", "<\\/")
 
-    tab_menu_html = ""
-    content_area_html = ""
+    # 문자열 += 누적 대신 리스트에 모아 마지막에 한 번만 join
+    tab_menu_parts: List[str] = []
+    content_area_parts: List[str] = []
 
-    for i, tab in enumerate(active_tabs):
-        active = (i == 0)
-        active_class = "bg-[#002d72] text-white shadow-lg" if active else "bg-white/50 text-slate-500 hover:bg-white"
-        display_style = "grid" if active else "none"
-        active_attr = "1" if active else "0"
+    # 카드 HTML은 탭과 무관(진입 딜레이만 다름)하고, 같은 행이 C7/C6 탭과 전체 탭에 중복 노출됨
+    # → 행당 한 번만 포맷/이스케이프해서 (딜레이 앞, 딜레이 뒤) 조각으로 보관
+    card_html: Dict[int, Tuple[str, str]] = {}
+    for r in rows:
+        code = r.get("코드", "") or ""
+        name_en = r.get("상품명(영문)", "") or ""
+        name_ko = r.get("상품명(한글)", "") or ""
+        official = r.get("공식몰가")
+        naver = r.get("네이버최저가")
+        diff = r.get("가격차이")
+        mall = r.get("최저가몰", "") or ""
+        link = r.get("링크", "") or ""
+
+        img_final = r.get("이미지URL", "") or ""
+        img_official = r.get("공식이미지URL", "") or ""
+        img_naver = r.get("네이버이미지URL", "") or ""
+        img_local = r.get("trimmed_local_path", "") or ""
+
+        prev_naver = r.get("prev_naver")
+        delta_naver = r.get("delta_naver")
+        conf = r.get("confidence", 0)
+        top3 = r.get("top3", []) or []
+
+        official_s = f"{official:,}원" if isinstance(official, int) else "-"
+        naver_s = f"{naver:,}원" if isinstance(naver, int) else "미검색"
+        diff_s = f"{diff:+,}원" if isinstance(diff, int) else "-"
+        prev_s = f"{prev_naver:,}원" if isinstance(prev_naver, int) else "-"
+        delta_s = f"{delta_naver:+,}원" if isinstance(delta_naver, int) else "-"
+
+        code_e = _safe_attr(code)
+        img_final_e = _safe_attr(img_final)
+
+        badge = ""
+        if isinstance(diff, int):
+            badge = f"""
+            <span class="px-3 py-1 rounded-full text-[10px] font-black {'bg-red-500/10 text-red-600' if diff > 0 else 'bg-emerald-500/10 text-emerald-700'}">
+              {'공식↑' if diff > 0 else '공식↓'} {diff_s}
+            </span>
+            """
 
-        tab_menu_html += f"""
-        <button onclick="switchTab('{tab}')" id="tab-{tab}" data-active="{active_attr}"
-          class="tab-btn px-6 py-3 rounded-2xl font-black transition-all text-sm {active_class}">
-          {tab} <span class="ml-1 opacity-60 text-xs">{len(groups[tab])}</span>
-        </button>
+        delta_badge = ""
+        if isinstance(delta_naver, int):
+            if delta_naver > 0:
+                cls = "bg-amber-500/10 text-amber-700"
+            elif delta_naver < 0:
+                cls = "bg-sky-500/10 text-sky-700"
+            else:
+                cls = "bg-slate-500/10 text-slate-700"
+            delta_badge = f"""
+            <span class="px-3 py-1 rounded-full text-[10px] font-black {cls}">
+              Δ최저가 {delta_s}
+            </span>
+            """
+
+        if conf >= 3:
+            conf_color = "bg-emerald-500/10 text-emerald-700"
+        elif conf == 2:
+            conf_color = "bg-amber-500/10 text-amber-800"
+        elif conf == 1:
+            conf_color = "bg-red-500/10 text-red-600"
+        else:
+            conf_color = "bg-slate-500/10 text-slate-700"
+
+        conf_badge = f"""
+        <span class="px-3 py-1 rounded-full text-[10px] font-black {conf_color}">
+          Match {conf}/5
+        </span>
         """
 
-        cards = ""
-        for card_idx, r in enumerate(groups[tab]):
-            code = r.get("코드", "") or ""
-            name_en = r.get("상품명(영문)", "") or ""
-            name_ko = r.get("상품명(한글)", "") or ""
-            official = r.get("공식몰가")
-            naver = r.get("네이버최저가")
-            diff = r.get("가격차이")
-            mall = r.get("최저가몰", "") or ""
-            link = r.get("링크", "") or ""
-
-            img_final = r.get("이미지URL", "") or ""
-            img_official = r.get("공식이미지URL", "") or ""
-            img_naver = r.get("네이버이미지URL", "") or ""
-            img_local = r.get("trimmed_local_path", "") or ""
-
-            prev_naver = r.get("prev_naver")
-            delta_naver = r.get("delta_naver")
-            conf = r.get("confidence", 0)
-            top3 = r.get("top3", []) or []
-
-            official_s = f"{official:,}원" if isinstance(official, int) else "-"
-            naver_s = f"{naver:,}원" if isinstance(naver, int) else "미검색"
-            diff_s = f"{diff:+,}원" if isinstance(diff, int) else "-"
-            prev_s = f"{prev_naver:,}원" if isinstance(prev_naver, int) else "-"
-            delta_s = f"{delta_naver:+,}원" if isinstance(delta_naver, int) else "-"
-
-            badge = ""
-            if isinstance(diff, int):
-                badge = f"""
-                <span class="px-3 py-1 rounded-full text-[10px] font-black {'bg-red-500/10 text-red-600' if diff > 0 else 'bg-emerald-500/10 text-emerald-700'}">
-                  {'공식↑' if diff > 0 else '공식↓'} {diff_s}
-                </span>
-                """
-
-            delta_badge = ""
-            if isinstance(delta_naver, int):
-                if delta_naver > 0:
-                    cls = "bg-amber-500/10 text-amber-700"
-                elif delta_naver < 0:
-                    cls = "bg-sky-500/10 text-sky-700"
-                else:
-                    cls = "bg-slate-500/10 text-slate-700"
-                delta_badge = f"""
-                <span class="px-3 py-1 rounded-full text-[10px] font-black {cls}">
-                  Δ최저가 {delta_s}
-                </span>
-                """
-
-            if conf >= 3:
-                conf_color = "bg-emerald-500/10 text-emerald-700"
-            elif conf == 2:
-                conf_color = "bg-amber-500/10 text-amber-800"
-            elif conf == 1:
-                conf_color = "bg-red-500/10 text-red-600"
+        src_badge = ""
+        if img_final:
+            if img_final == img_official and img_official:
+                src_badge = """<span class="px-3 py-1 rounded-full text-[10px] font-black bg-blue-500/10 text-blue-700">IMG: OFFICIAL</span>"""
+            elif img_final == img_naver and img_naver:
+                src_badge = """<span class="px-3 py-1 rounded-full text-[10px] font-black bg-purple-500/10 text-purple-700">IMG: NAVER</span>"""
             else:
-                conf_color = "bg-slate-500/10 text-slate-700"
+                src_badge = """<span class="px-3 py-1 rounded-full text-[10px] font-black bg-slate-500/10 text-slate-700">IMG: MIX</span>"""
 
-            conf_badge = f"""
-            <span class="px-3 py-1 rounded-full text-[10px] font-black {conf_color}">
-              Match {conf}/5
-            </span>
-            """
+        top3_parts: List[str] = []
+        for idx, it in enumerate(top3[:3], start=1):
+            lp = it.get("lprice")
+            mn = it.get("mallName", "") or ""
+            lk = it.get("link", "") or ""
+            lp_s = f"{int(lp):,}원" if isinstance(lp, int) else "-"
+            top3_parts.append(f"""
+            <div class="flex items-center justify-between gap-3 py-2">
+              <div class="text-xs font-black text-slate-700">#{idx} {lp_s}</div>
+              <div class="text-[11px] font-bold text-slate-500 line-clamp-1 flex-1">{_safe_attr(mn)}</div>
+              <a href="{_safe_attr(lk)}" target="_blank" class="text-[11px] font-black text-blue-700 hover:underline">link</a>
+            </div>
+            """)
+        top3_lines = "".join(top3_parts)
+
+        top3_block = f"""
+        <details class="mt-2">
+          <summary class="cursor-pointer select-none text-[11px] font-black text-slate-600">
+            Top3 최저가 보기
+          </summary>
+          <div class="mt-3 p-4 rounded-2xl bg-white/60 border border-white">
+            {top3_lines if top3_lines else '<div class="text-xs font-bold text-slate-500">Top3 데이터 없음</div>'}
+          </div>
+        </details>
+        """
 
-            src_badge = ""
-            if img_final:
-                if img_final == img_official and img_official:
-                    src_badge = """<span class="px-3 py-1 rounded-full text-[10px] font-black bg-blue-500/10 text-blue-700">IMG: OFFICIAL</span>"""
-                elif img_final == img_naver and img_naver:
-                    src_badge = """<span class="px-3 py-1 rounded-full text-[10px] font-black bg-purple-500/10 text-purple-700">IMG: NAVER</span>"""
-                else:
-                    src_badge = """<span class="px-3 py-1 rounded-full text-[10px] font-black bg-slate-500/10 text-slate-700">IMG: MIX</span>"""
-
-            top3_lines = ""
-            for idx, it in enumerate(top3[:3], start=1):
-                lp = it.get("lprice")
-                mn = it.get("mallName", "") or ""
-                lk = it.get("link", "") or ""
-                lp_s = f"{int(lp):,}원" if isinstance(lp, int) else "-"
-                top3_lines += f"""
-                <div class="flex items-center justify-between gap-3 py-2">
-                  <div class="text-xs font-black text-slate-700">#{idx} {lp_s}</div>
-                  <div class="text-[11px] font-bold text-slate-500 line-clamp-1 flex-1">{_safe_attr(mn)}</div>
-                  <a href="{_safe_attr(lk)}" target="_blank" class="text-[11px] font-black text-blue-700 hover:underline">link</a>
-                </div>
-                """
-
-            top3_block = f"""
-            <details class="mt-2">
-              <summary class="cursor-pointer select-none text-[11px] font-black text-slate-600">
-                Top3 최저가 보기
-              </summary>
-              <div class="mt-3 p-4 rounded-2xl bg-white/60 border border-white">
-                {top3_lines if top3_lines else '<div class="text-xs font-bold text-slate-500">Top3 데이터 없음</div>'}
+        missing_flag = 1 if (naver is None) else 0
+        diff_pos_flag = 1 if (isinstance(diff, int) and diff > 0) else 0
+        diff_abs = abs(diff) if isinstance(diff, int) else -1
+        naver_num = naver if isinstance(naver, int) else -1
+        official_num = official if isinstance(official, int) else -1
+        delta_num = delta_naver if isinstance(delta_naver, int) else 10**18
+        conf_num = conf if isinstance(conf, int) else 0
+
+        # 검색 비교용 data-* 값은 여기서 소문자로 한 번만 정규화 (JS는 그대로 includes)
+        data_code = _safe_attr(code.lower())
+        data_name_en = _safe_attr(name_en.lower())
+        data_name_ko = _safe_attr(name_ko.lower())
+
+        img_block = ""
+        if img_final.strip():
+            img_block = f"""
+            <div class="mb-4">
+              <div class="w-full img-box rounded-2xl border border-white/80 bg-white/60 overflow-hidden relative">
+                <label class="chk-float inline-flex items-center gap-2 text-[11px] font-black text-slate-700 cursor-pointer select-none">
+                  <input type="checkbox" class="w-4 h-4 accent-[#002d72] chk" />
+                  CHECK
+                </label>
+
+                <img
+                  src="{img_final_e}"
+                  data-src-raw="{_safe_attr(r.get("raw_image_url","") or "")}"
+                  alt="{_safe_attr(name_en or name_ko)}"
+                  class="img-fit"
+                  loading="lazy"
+                  decoding="async"
+                  fetchpriority="low"
+                  onclick="openImg('{img_final_e}', '{_safe_attr(img_local)}')"
+                  onerror="this.classList.add('hidden'); if(this.parentElement && this.parentElement.nextElementSibling) this.parentElement.nextElementSibling.classList.remove('hidden');"
+                />
+              </div>
+              <div class="hidden w-full img-box rounded-2xl border border-white/80 bg-white/60 flex items-center justify-center">
+                <i class="fa-solid fa-image text-slate-400 text-2xl"></i>
               </div>
-            </details>
+            </div>
             """
 
-            missing_flag = 1 if (naver is None) else 0
-            diff_pos_flag = 1 if (isinstance(diff, int) and diff > 0) else 0
-            diff_abs = abs(diff) if isinstance(diff, int) else -1
-            naver_num = naver if isinstance(naver, int) else -1
-            official_num = official if isinstance(official, int) else -1
-            delta_num = delta_naver if isinstance(delta_naver, int) else 10**18
-            conf_num = conf if isinstance(conf, int) else 0
-
-            data_code = _safe_attr(code.lower())
-            data_name_en = _safe_attr(name_en.lower())
-            data_name_ko = _safe_attr(name_ko.lower())
-
-            img_block = ""
-            if img_final.strip():
-                img_block = f"""
-                <div class="mb-4">
-                  <div class="w-full img-box rounded-2xl border border-white/80 bg-white/60 overflow-hidden relative">
-                    <label class="chk-float inline-flex items-center gap-2 text-[11px] font-black text-slate-700 cursor-pointer select-none">
-                      <input type="checkbox" class="w-4 h-4 accent-[#002d72] chk"
-                        onchange="toggleCheck('{_safe_attr(code)}', this.checked)" />
-                      CHECK
-                    </label>
-
-                    <img
-                      src="{_safe_attr(img_final)}"
-                      data-src-raw="{_safe_attr(r.get("raw_image_url","") or "")}"
-                      alt="{_safe_attr(name_en or name_ko)}"
-                      class="img-fit"
-                      loading="lazy"
-                      onclick="openImg('{_safe_attr(img_final)}', '{_safe_attr(img_local)}')"
-                      onerror="this.classList.add('hidden'); if(this.parentElement && this.parentElement.nextElementSibling) this.parentElement.nextElementSibling.classList.remove('hidden');"
-                    />
-                  </div>
-                  <div class="hidden w-full img-box rounded-2xl border border-white/80 bg-white/60 flex items-center justify-center">
-                    <i class="fa-solid fa-image text-slate-400 text-2xl"></i>
-                  </div>
-                </div>
-                """
-
-            title_main = _safe_attr(name_ko) if name_ko else _safe_attr(name_en)
-            title_sub = _safe_attr(name_en) if name_ko else ""
-
-            cards += f"""
-            <div class="glass-card p-6 border-white/80 card-item card-in flex flex-col"
-              style="--enter-delay:{min(card_idx * 45, 280)}ms;"
-              data-code="{data_code}" data-nameen="{data_name_en}" data-nameko="{data_name_ko}"
-              data-missing="{missing_flag}" data-diffpos="{diff_pos_flag}"
-              data-diff="{diff if isinstance(diff,int) else ''}" data-diffabs="{diff_abs}"
-              data-naver="{naver_num}" data-official="{official_num}"
-              data-delta="{delta_num}" data-conf="{conf_num}"
-              data-code-raw="{_safe_attr(code)}">
-
-              {img_block}
-
-              <div class="flex items-start justify-between gap-3 mb-4">
-                <div class="min-w-0">
-                  <div class="text-xs font-black tracking-widest text-slate-400 uppercase mb-2">{_safe_attr(code)}</div>
-                  <div class="text-slate-900 font-extrabold leading-snug line-clamp-2">{title_main}</div>
-                  <div class="text-[11px] font-bold text-slate-500 mt-1 line-clamp-1">{title_sub}</div>
-
-                  <div class="mt-3 flex flex-wrap gap-2">
-                    {badge} {delta_badge} {conf_badge} {src_badge}
-                  </div>
-
-                  {top3_block}
-                </div>
+        name_en_e = _safe_attr(name_en)
+        title_main = _safe_attr(name_ko) if name_ko else name_en_e
+        title_sub = name_en_e if name_ko else ""
+
+        card_html[id(r)] = ("""
+        <div class="glass-card p-6 border-white/80 card-item card-in flex flex-col"
+          style="--enter-delay:""", f"""ms;"
+          data-code="{data_code}" data-nameen="{data_name_en}" data-nameko="{data_name_ko}"
+          data-missing="{missing_flag}" data-diffpos="{diff_pos_flag}"
+          data-diff="{diff if isinstance(diff,int) else ''}" data-diffabs="{diff_abs}"
+          data-naver="{naver_num}" data-official="{official_num}"
+          data-delta="{delta_num}" data-conf="{conf_num}"
+          data-code-raw="{code_e}">
+
+          {img_block}
+
+          <div class="flex items-start justify-between gap-3 mb-4">
+            <div class="min-w-0">
+              <div class="text-xs font-black tracking-widest text-slate-400 uppercase mb-2">{code_e}</div>
+              <div class="text-slate-900 font-extrabold leading-snug line-clamp-2">{title_main}</div>
+              <div class="text-[11px] font-bold text-slate-500 mt-1 line-clamp-1">{title_sub}</div>
+
+              <div class="mt-3 flex flex-wrap gap-2">
+                {badge} {delta_badge} {conf_badge} {src_badge}
               </div>
 
-              <div class="grid grid-cols-2 gap-3 mb-4">
-                <div class="p-4 rounded-2xl bg-white/60 border border-white">
-                  <div class="text-[10px] font-black tracking-widest text-slate-400 uppercase mb-1">공식몰가</div>
-                  <div class="text-lg font-black text-slate-900">{official_s}</div>
-                </div>
-                <div class="p-4 rounded-2xl bg-white/60 border border-white">
-                  <div class="text-[10px] font-black tracking-widest text-slate-400 uppercase mb-1">네이버최저가</div>
-                  <div class="text-lg font-black text-slate-900">{naver_s}</div>
-                  <div class="text-[10px] font-bold text-slate-500 mt-1">{_safe_attr(mall)}</div>
-                </div>
-              </div>
+              {top3_block}
+            </div>
+          </div>
 
-              <div class="grid grid-cols-2 gap-3 mb-5">
-                <div class="p-4 rounded-2xl bg-white/60 border border-white">
-                  <div class="text-[10px] font-black tracking-widest text-slate-400 uppercase mb-1">전일 최저가</div>
-                  <div class="text-base font-black text-slate-900">{prev_s}</div>
-                </div>
-                <div class="p-4 rounded-2xl bg-white/60 border border-white">
-                  <div class="text-[10px] font-black tracking-widest text-slate-400 uppercase mb-1">Δ 최저가</div>
-                  <div class="text-base font-black text-slate-900">{delta_s}</div>
-                </div>
-              </div>
+          <div class="grid grid-cols-2 gap-3 mb-4">
+            <div class="p-4 rounded-2xl bg-white/60 border border-white">
+              <div class="text-[10px] font-black tracking-widest text-slate-400 uppercase mb-1">공식몰가</div>
+              <div class="text-lg font-black text-slate-900">{official_s}</div>
+            </div>
+            <div class="p-4 rounded-2xl bg-white/60 border border-white">
+              <div class="text-[10px] font-black tracking-widest text-slate-400 uppercase mb-1">네이버최저가</div>
+              <div class="text-lg font-black text-slate-900">{naver_s}</div>
+              <div class="text-[10px] font-bold text-slate-500 mt-1">{_safe_attr(mall)}</div>
+            </div>
+          </div>
 
-              <div class="mb-4">
-                <div class="text-[10px] font-black uppercase tracking-[0.3em] text-slate-400 mb-2 flex items-center gap-2">
-                  <i class="fa-solid fa-note-sticky"></i> Memo
-                </div>
-                <textarea class="w-full input-glass text-sm font-bold text-slate-800" rows="2"
-                  placeholder="메모를 남겨두면 이 브라우저에 저장돼요 (예: MD 확인 필요 / 옵션가 의심)"
-                  oninput="saveMemo('{_safe_attr(code)}', this.value)"></textarea>
-              </div>
+          <div class="grid grid-cols-2 gap-3 mb-5">
+            <div class="p-4 rounded-2xl bg-white/60 border border-white">
+              <div class="text-[10px] font-black tracking-widest text-slate-400 uppercase mb-1">전일 최저가</div>
+              <div class="text-base font-black text-slate-900">{prev_s}</div>
+            </div>
+            <div class="p-4 rounded-2xl bg-white/60 border border-white">
+              <div class="text-[10px] font-black tracking-widest text-slate-400 uppercase mb-1">Δ 최저가</div>
+              <div class="text-base font-black text-slate-900">{delta_s}</div>
+            </div>
+          </div>
 
-              <div class="mt-auto flex items-center justify-between pt-4 border-t border-slate-100">
-                <span class="text-[10px] font-bold text-slate-400 uppercase tracking-widest">가격차이: {diff_s}</span>
-                <a href="{_safe_attr(link)}" target="_blank"
-                  class="px-4 py-2 bg-[#002d72] text-white text-[10px] font-black rounded-xl hover:bg-blue-600 transition-colors flex items-center gap-2">
-                  최저가 링크 <i class="fa-solid fa-arrow-up-right"></i>
-                </a>
-              </div>
+          <div class="mb-4">
+            <div class="text-[10px] font-black uppercase tracking-[0.3em] text-slate-400 mb-2 flex items-center gap-2">
+              <i class="fa-solid fa-note-sticky"></i> Memo
             </div>
-            """
+            <textarea class="w-full input-glass text-sm font-bold text-slate-800" rows="2"
+              placeholder="메모를 남겨두면 이 브라우저에 저장돼요 (예: MD 확인 필요 / 옵션가 의심)"></textarea>
+          </div>
 
-        content_area_html += f"""
+          <div class="mt-auto flex items-center justify-between pt-4 border-t border-slate-100">
+            <span class="text-[10px] font-bold text-slate-400 uppercase tracking-widest">가격차이: {diff_s}</span>
+            <a href="{_safe_attr(link)}" target="_blank"
+              class="px-4 py-2 bg-[#002d72] text-white text-[10px] font-black rounded-xl hover:bg-blue-600 transition-colors flex items-center gap-2">
+              최저가 링크 <i class="fa-solid fa-arrow-up-right"></i>
+            </a>
+          </div>
+        </div>
+        """)
+
+    for i, tab in enumerate(active_tabs):
+        active = (i == 0)
+        active_class = "bg-[#002d72] text-white shadow-lg" if active else "bg-white/50 text-slate-500 hover:bg-white"
+        display_style = "grid" if active else "none"
+        active_attr = "1" if active else "0"
+
+        tab_menu_parts.append(f"""
+        <button onclick="switchTab('{tab}')" id="tab-{tab}" data-active="{active_attr}"
+          class="tab-btn px-6 py-3 rounded-2xl font-black transition-all text-sm {active_class}">
+          {tab} <span class="ml-1 opacity-60 text-xs">{len(groups[tab])}</span>
+        </button>
+        """)
+
+        cards_parts: List[str] = []
+        for card_idx, r in enumerate(groups[tab]):
+            head, tail = card_html[id(r)]
+            cards_parts.append(f"{head}{min(card_idx * 45, 280)}{tail}")
+        cards = "".join(cards_parts)
+
+        content_area_parts.append(f"""
         <div id="content-{tab}" class="tab-content grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6"
           style="display: {display_style};">
           {cards if cards else '<div class="text-slate-500 font-bold">데이터가 없습니다.</div>'}
         </div>
-        """
+        """)
+
+    tab_menu_html = "".join(tab_menu_parts)
+    content_area_html = "".join(content_area_parts)
 
     now_str = meta.get("generated_at", datetime.now().strftime("%Y-%m-%d %H:%M"))
     prev_csv_used = meta.get("prev_csv_used")
     prev_label = os.path.basename(prev_csv_used) if prev_csv_used else "없음(비교 불가)"
 
-    rows_json = json.dumps(rows, ensure_ascii=False)
+    # <script> 안에 그대로 들어가므로 "</" 만 이스케이프 (JSON 값은 동일)
+    rows_json = _json_dumps(rows).replace("</", "<\\/")
 
     html_tpl = r"""<!DOCTYPE html>
 <html lang="ko">
@@ -1281,6 +1525,8 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
       position: relative;
       overflow: hidden;
       border-color: rgba(255,255,255,0.84);
+      content-visibility: auto;
+      contain-intrinsic-size: auto 560px;
     }
     .card-item::before {
       content: "";
@@ -1294,6 +1540,7 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
       box-shadow: var(--shadow-hover);
       border-color: rgba(191,219,254,0.95);
     }
+    .filter-hidden, .window-hidden { display: none !important; }
     .card-item.card-in {
       animation: cardEnter .65s cubic-bezier(.22,1,.36,1) both;
       animation-delay: var(--enter-delay, 0ms);
@@ -1496,6 +1743,7 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
         <div class="flex flex-wrap gap-2">__TAB_MENU__</div>
       </div>
       <div class="min-h-[500px]">__CONTENT_AREA__</div>
+      <div id="windowSentinel" style="height:1px"></div>
     </section>
   </main>
 
@@ -1509,11 +1757,75 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
     </div>
   </div>
 
+<script type="application/json" id="rows-data">__ROWS_JSON__</script>
 <script>
-  const ALL_ROWS = __ROWS_JSON__;
+  // 행 데이터는 CSV 다운로드 때만 필요 → 첫 사용 시점에 JSON.parse
+  let _allRows = null;
+  // 파싱 실패 시 빈 배열로 넘기면 빈 CSV가 조용히 저장되므로, 알리고 null을 돌려 다운로드를 중단
+  function getAllRows() {
+    if (_allRows === null) {
+      try {
+        _allRows = JSON.parse(document.getElementById('rows-data').textContent || '[]');
+      } catch (e) {
+        console.error('rows-data JSON parse failed', e);
+        alert('행 데이터를 읽지 못해 CSV를 만들 수 없습니다. (rows-data JSON 파싱 실패)');
+        return null;
+      }
+    }
+    return _allRows;
+  }
   const TOP_GAP_CODES = __TOP_GAP_CODES_JSON__;
+  const TOP_GAP_SET = new Set(TOP_GAP_CODES);
   const quick = { diffpos: false, missing: false, topgap: false };
 
+  // 카드 data-* 값을 로드 시 한 번만 읽어 두는 인덱스 → 검색/정렬 중에는 getAttribute 없음
+  // TAB_ORDER[container.id] = 해당 탭 카드 entry 배열 (현재 DOM 순서 유지)
+  const INDEX = [];
+  const TAB_ORDER = {};
+
+  // 필터 결과 캐시: (탭, 검색 여부, chip, 검색어) → INDEX id별 통과 플래그. 최근 16개만 유지 (LRU)
+  const FILTER_CACHE = new Map();
+  const FILTER_CACHE_MAX = 16;
+
+  // 탭별로 마지막에 적용한 필터 키/정렬 모드: 같으면 탭 전환·chip 토글 시 재필터·재정렬 생략
+  const TAB_STATE = {};
+
+  function numOrNull(v) {
+    if (v === null || v === '') return null;
+    const n = Number(v);
+    return isNaN(n) ? null : n;
+  }
+
+  function buildIndex() {
+    document.querySelectorAll('.tab-content').forEach(container => {
+      const list = [];
+      container.querySelectorAll('.card-item').forEach(el => {
+        const entry = {
+          id: INDEX.length,
+          el,
+          // 이미 소문자로 렌더된 이름/코드를 한 문자열로 묶어 검색 시 includes 1회
+          text: (el.getAttribute('data-nameen') || '') + '\n' + (el.getAttribute('data-nameko') || '') + '\n' + (el.getAttribute('data-code') || ''),
+          codeRaw: el.getAttribute('data-code-raw') || '',
+          missing: el.getAttribute('data-missing') === '1',
+          diffpos: el.getAttribute('data-diffpos') === '1',
+          diff: numOrNull(el.getAttribute('data-diff')),
+          diffabs: numOrNull(el.getAttribute('data-diffabs')),
+          naver: numOrNull(el.getAttribute('data-naver')),
+          official: numOrNull(el.getAttribute('data-official')),
+          delta: numOrNull(el.getAttribute('data-delta')),
+          conf: numOrNull(el.getAttribute('data-conf')),
+          hidden: false,
+          windowed: false,
+        };
+        list.push(entry);
+        INDEX.push(entry);
+      });
+      TAB_ORDER[container.id] = list;
+    });
+    SORT_KEYS = buildSortKeys(INDEX);
+    FILTER_BITS = buildFilterBits(INDEX, TOP_GAP_SET);
+  }
+
   const state = { q: "", sortMode: "diffabs_desc", hasSearched: false, gridMode: 3 };
 
   const overlay = document.getElementById('overlay');
@@ -1521,9 +1833,46 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
 
   function showOverlay(msg) { overlayMsg.textContent = msg || "잠시만요"; overlay.classList.add('show'); }
   function hideOverlay() { overlay.classList.remove('show'); }
+
+  // 직전 작업이 50ms 미만이었으면 오버레이 없이 바로 실행 (setTimeout/rAF 왕복과 깜빡임 제거)
+  const OVERLAY_THRESHOLD_MS = 50;
+  let lastRunMs = Infinity;
+  // 아직 끝나지 않은 화면 계산 수 (오버레이 뒤로 미룬 작업 + Worker 응답 대기)
+  // 0이 될 때 오버레이를 닫고 소요 시간을 잰다
+  let pendingViews = 0;
+  let viewT0 = 0;
+  const viewWaiters = [];
+
+  function runTimed(fn) {
+    const t0 = performance.now();
+    try { fn(); } finally {
+      // Worker로 넘어간 경우 시간은 onViewResult에서 응답 도착 기준으로 기록
+      if (!pendingViews) lastRunMs = performance.now() - t0;
+    }
+  }
   function runWithOverlay(msg, fn) {
+    if (lastRunMs < OVERLAY_THRESHOLD_MS) { runTimed(fn); return; }
+    beginView();
     showOverlay(msg);
-    setTimeout(() => { try { fn(); } finally { requestAnimationFrame(() => hideOverlay()); } }, 0);
+    setTimeout(() => { try { fn(); } finally { endView(); } }, 0);
+  }
+
+  function beginView() {
+    if (pendingViews++ === 0) viewT0 = performance.now();
+    overlay.classList.add('show');
+  }
+
+  function endView() {
+    if (pendingViews === 0 || --pendingViews > 0) return;
+    lastRunMs = performance.now() - viewT0;
+    requestAnimationFrame(() => { if (!pendingViews) hideOverlay(); });
+    viewWaiters.splice(0).forEach(fn => fn());
+  }
+
+  // 필터 결과를 읽는 작업(CSV 등)은 Worker 응답이 모두 반영된 뒤 실행
+  function whenViewsSettled(fn) {
+    if (pendingViews === 0) fn();
+    else viewWaiters.push(fn);
   }
 
   function getActiveTabName() {
@@ -1537,11 +1886,7 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
     return document.getElementById('content-' + tab);
   }
 
-  function updateCount() {
-    const container = getActiveContainer();
-    if (!container) return;
-    const visibleCards = container.querySelectorAll('.card-item:not([data-hidden="1"])');
-    const cnt = visibleCards.length;
+  function updateCount(cnt) {
     document.getElementById('matchCount').innerText = cnt.toString();
 
     const noResults = document.getElementById('noResults');
@@ -1553,19 +1898,90 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
 
   function keyCheck(code) { return 'chk_' + code; }
   function keyMemo(code) { return 'memo_' + code; }
-  function toggleCheck(code, checked) { try { localStorage.setItem(keyCheck(code), checked ? '1' : '0'); } catch(e) {} }
-  function saveMemo(code, text) { try { localStorage.setItem(keyMemo(code), text || ''); } catch(e) {} }
+
+  // check/memo 상태는 메모리 Map에서 읽고, 저장은 IndexedDB(없으면 localStorage)에 비동기로 반영
+  const CARD_STATE = new Map();
+  const CARD_STATE_TOUCHED = new Set();
+  const IDB_NAME = 'naver-price-portal';
+  const IDB_STORE = 'card_state';
+  let idbPromise = null;
+
+  function openIdb() {
+    if (!idbPromise) {
+      idbPromise = new Promise((resolve, reject) => {
+        if (!('indexedDB' in window)) { reject(new Error('indexedDB unavailable')); return; }
+        const req = indexedDB.open(IDB_NAME, 1);
+        req.onupgradeneeded = () => req.result.createObjectStore(IDB_STORE);
+        req.onsuccess = () => resolve(req.result);
+        req.onerror = () => reject(req.error);
+      });
+    }
+    return idbPromise;
+  }
+
+  function loadCardState() {
+    // 예전 localStorage 값을 한 번 훑어 올리고, IndexedDB 값은 한 트랜잭션으로 읽어 덮는다
+    try {
+      for (let i = 0; i < localStorage.length; i++) {
+        const k = localStorage.key(i);
+        if (k && (k.startsWith('chk_') || k.startsWith('memo_'))) CARD_STATE.set(k, localStorage.getItem(k));
+      }
+    } catch(e) {}
+
+    return openIdb().then(db => new Promise(resolve => {
+      const store = db.transaction(IDB_STORE, 'readonly').objectStore(IDB_STORE);
+      const keysReq = store.getAllKeys();
+      const valsReq = store.getAll();
+      valsReq.onsuccess = () => {
+        keysReq.result.forEach((k, i) => {
+          if (!CARD_STATE_TOUCHED.has(k)) CARD_STATE.set(k, valsReq.result[i]);
+        });
+        resolve();
+      };
+      valsReq.onerror = () => resolve();
+    })).catch(() => {});
+  }
+
+  function setCardState(key, value) {
+    CARD_STATE.set(key, value);
+    CARD_STATE_TOUCHED.add(key);
+    openIdb()
+      .then(db => { db.transaction(IDB_STORE, 'readwrite').objectStore(IDB_STORE).put(value, key); })
+      .catch(() => { try { localStorage.setItem(key, value); } catch(e) {} });
+  }
+
+  function toggleCheck(code, checked) { setCardState(keyCheck(code), checked ? '1' : '0'); }
+  function saveMemo(code, text) { setCardState(keyMemo(code), text || ''); }
+
+  // 카드별 inline 핸들러 대신 탭 컨테이너마다 change/input 리스너 1개씩 위임
+  function bindCardControls() {
+    const cardCode = (target) => {
+      const card = target.closest('.card-item');
+      return card ? (card.getAttribute('data-code-raw') || '') : null;
+    };
+    document.querySelectorAll('.tab-content').forEach(container => {
+      container.addEventListener('change', (e) => {
+        if (!e.target.matches('input.chk')) return;
+        const code = cardCode(e.target);
+        if (code !== null) toggleCheck(code, e.target.checked);
+      });
+      container.addEventListener('input', (e) => {
+        if (e.target.tagName !== 'TEXTAREA') return;
+        const code = cardCode(e.target);
+        if (code !== null) saveMemo(code, e.target.value);
+      });
+    });
+  }
 
   function hydrateCardState() {
-    document.querySelectorAll('.card-item').forEach(card => {
-      const code = card.getAttribute('data-code-raw') || '';
+    INDEX.forEach(entry => {
+      const card = entry.el;
       const chk = card.querySelector('input.chk');
-      if (chk) {
-        try { chk.checked = (localStorage.getItem(keyCheck(code)) === '1'); } catch(e) {}
-      }
+      if (chk) chk.checked = (CARD_STATE.get(keyCheck(entry.codeRaw)) === '1');
       const ta = card.querySelector('textarea');
       if (ta) {
-        try { const v = localStorage.getItem(keyMemo(code)); if (v !== null) ta.value = v; } catch(e) {}
+        const v = CARD_STATE.get(keyMemo(entry.codeRaw));
+        if (v !== undefined) ta.value = v;
       }
     });
   }
@@ -1577,55 +1993,204 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
     onApplyClick();
   }
 
-  function passesFilters(card) {
-    if (!state.hasSearched) return true;
+  let FILTER_BITS = null;
+
+  // 아래 build*/filterIds/makeIdComparator는 DOM·전역 state를 쓰지 않는 순수 함수 → Worker 소스에도 그대로 들어간다
+  function buildFilterBits(entries, topGapSet) {
+    // quick chip 조건을 id별 바이트 배열로 펼쳐 두고, 검색 대상 문자열만 따로 배열로
+    const n = entries.length;
+    const bits = { text: new Array(n), diffpos: new Uint8Array(n), missing: new Uint8Array(n), topgap: new Uint8Array(n) };
+    entries.forEach((e, i) => {
+      bits.text[i] = e.text;
+      bits.diffpos[i] = e.diffpos ? 1 : 0;
+      bits.missing[i] = e.missing ? 1 : 0;
+      bits.topgap[i] = topGapSet.has(e.codeRaw) ? 1 : 0;
+    });
+    return bits;
+  }
+
+  function isTightening(prev, f) {
+    // prev에서 떨어진 카드는 f에서도 반드시 떨어지는가: 검색어가 이전 검색어를 포함하고 chip은 켜지기만 한 경우
+    if (!prev || !prev.hasSearched) return !!prev;
+    if (!f.hasSearched) return false;
+    return f.q.includes(prev.q)
+      && (f.diffpos || !prev.diffpos)
+      && (f.missing || !prev.missing)
+      && (f.topgap || !prev.topgap);
+  }
 
-    const nameEn = card.getAttribute('data-nameen') || '';
-    const nameKo = card.getAttribute('data-nameko') || '';
-    const code = card.getAttribute('data-code') || '';
-    const missing = card.getAttribute('data-missing') === '1';
-    const diffpos = card.getAttribute('data-diffpos') === '1';
-    const codeRaw = card.getAttribute('data-code-raw') || '';
+  function filterIds(ids, bits, f) {
+    const flags = new Uint8Array(bits.text.length);
+    for (const i of ids) {
+      if (f.hasSearched) {
+        if (f.q && !bits.text[i].includes(f.q)) continue;
+        if (f.diffpos && !bits.diffpos[i]) continue;
+        if (f.missing && !bits.missing[i]) continue;
+        if (f.topgap && !bits.topgap[i]) continue;
+      }
+      flags[i] = 1;
+    }
+    return flags;
+  }
 
-    const q = state.q || "";
-    const ok = !q || nameEn.includes(q) || nameKo.includes(q) || code.includes(q);
+  // 숫자 정렬 모드별 [필드, 빈 값 fallback(기존 getNum 규칙과 동일), 방향]
+  const SORT_COLS = {
+    diffabs_desc:  ['diffabs', -1, -1],
+    diff_desc:     ['diff', -1e18, -1],
+    diff_asc:      ['diff', 1e18, 1],
+    naver_asc:     ['naver', 1e18, 1],
+    naver_desc:    ['naver', -1, -1],
+    official_desc: ['official', -1, -1],
+    delta_asc:     ['delta', 1e18, 1],
+    delta_desc:    ['delta', -1e18, -1],
+    conf_desc:     ['conf', 0, -1],
+  };
+  const SORT_MODES = Object.keys(SORT_COLS);
+  let SORT_KEYS = null;
+
+  function buildSortKeys(entries) {
+    // entry i의 모드 c 키 = keys[i * 모드수 + c]. desc는 부호를 뒤집어 모든 비교를 오름차순 뺄셈 하나로
+    const n = SORT_MODES.length;
+    const keys = new Float64Array(entries.length * n);
+    entries.forEach((e, i) => {
+      SORT_MODES.forEach((mode, c) => {
+        const [field, fb, dir] = SORT_COLS[mode];
+        keys[i * n + c] = dir * (e[field] === null ? fb : e[field]);
+      });
+    });
+    return keys;
+  }
 
-    if (!ok) return false;
-    if (quick.diffpos && !diffpos) return false;
-    if (quick.missing && !missing) return false;
-    if (quick.topgap && !TOP_GAP_CODES.includes(codeRaw)) return false;
+  function makeIdComparator(mode, keys, entries, collator) {
+    const col = SORT_MODES.indexOf(mode);
+    if (col >= 0) {
+      const n = SORT_MODES.length;
+      return (a, b) => keys[a * n + col] - keys[b * n + col];
+    }
+    if (mode === 'code_asc') return (a, b) => collator.compare(entries[a].codeRaw, entries[b].codeRaw);
+    return (a, b) => 0;
+  }
 
-    return true;
+  function currentFilter() {
+    return { hasSearched: state.hasSearched, q: state.q || "", diffpos: quick.diffpos, missing: quick.missing, topgap: quick.topgap };
   }
 
+  // localeCompare(…, 'en')와 같은 순서를 내는 collator를 한 번만 생성
+  const CODE_COLLATOR = new Intl.Collator('en');
+
   function sortCards(container) {
-    const mode = state.sortMode;
-    const cards = Array.from(container.querySelectorAll('.card-item'));
-
-    const getNum = (el, attr, fallback=0) => {
-      const v = el.getAttribute(attr);
-      if (v === null || v === '' || v === undefined) return fallback;
-      const n = Number(v);
-      return isNaN(n) ? fallback : n;
+    const ids = (TAB_ORDER[container.id] || []).map(e => e.id);
+    ids.sort(makeIdComparator(state.sortMode, SORT_KEYS, INDEX, CODE_COLLATOR));
+    const list = ids.map(id => INDEX[id]);
+    TAB_ORDER[container.id] = list;
+    reorderCards(container, list);
+  }
+
+  function reorderCards(container, list) {
+    // fragment에 모아 한 번에 붙여 재배치 reflow를 1회로 (spread 인자 수 제한도 회피)
+    const frag = document.createDocumentFragment();
+    for (const e of list) frag.appendChild(e.el);
+    container.appendChild(frag);
+  }
+
+  // 카드가 많을 때 필터/정렬 계산을 Worker로 넘긴다. Worker는 탭별 id 순서를 따로 들고 있다가
+  // 결과(통과 플래그, 정렬된 id)만 돌려주고, DOM 반영은 메인 스레드에서 도착 순서대로 한다.
+  const VIEW_WORKER_SRC = [buildFilterBits, isTightening, filterIds, buildSortKeys, makeIdComparator].map(String).join('\n')
+    + '\nconst SORT_COLS = ' + JSON.stringify(SORT_COLS) + ';\nconst SORT_MODES = Object.keys(SORT_COLS);' + `
+    let ENTRIES = [];
+    let KEYS = null;
+    let ORDER = {};
+    let BITS = null;
+    const LAST = {};
+    const COLLATOR = new Intl.Collator('en');
+    self.onmessage = (e) => {
+      const m = e.data;
+      if (m.type === 'init') {
+        ENTRIES = m.entries;
+        KEYS = buildSortKeys(ENTRIES);
+        ORDER = m.order;
+        BITS = buildFilterBits(ENTRIES, new Set(m.topGap));
+        return;
+      }
+      const ids = ORDER[m.tabId] || [];
+      let flags = null;
+      let order = null;
+      if (m.filter) {
+        // 조건이 좁아지기만 했으면 직전 통과분만 다시 검사
+        const last = LAST[m.tabId];
+        const cand = (last && isTightening(last.filter, m.filter)) ? ids.filter(id => last.flags[id]) : ids;
+        flags = filterIds(cand, BITS, m.filter);
+        LAST[m.tabId] = { filter: m.filter, flags: flags.slice() };
+      }
+      if (m.sortMode !== null) {
+        ids.sort(makeIdComparator(m.sortMode, KEYS, ENTRIES, COLLATOR));
+        order = Int32Array.from(ids);
+      }
+      self.postMessage({ tabId: m.tabId, key: m.key, filter: m.filter, flags, order }, [flags, order].filter(Boolean).map(x => x.buffer));
     };
-    const getStr = (el, attr) => (el.getAttribute(attr) || '').toString();
-
-    let cmp;
-    switch(mode) {
-      case 'diffabs_desc': cmp = (a,b) => getNum(b,'data-diffabs',-1) - getNum(a,'data-diffabs',-1); break;
-      case 'diff_desc':    cmp = (a,b) => getNum(b,'data-diff',-1e18) - getNum(a,'data-diff',-1e18); break;
-      case 'diff_asc':     cmp = (a,b) => getNum(a,'data-diff', 1e18) - getNum(b,'data-diff', 1e18); break;
-      case 'naver_asc':    cmp = (a,b) => getNum(a,'data-naver',1e18) - getNum(b,'data-naver',1e18); break;
-      case 'naver_desc':   cmp = (a,b) => getNum(b,'data-naver',-1) - getNum(a,'data-naver',-1); break;
-      case 'official_desc':cmp = (a,b) => getNum(b,'data-official',-1) - getNum(a,'data-official',-1); break;
-      case 'code_asc':     cmp = (a,b) => getStr(a,'data-code-raw').localeCompare(getStr(b,'data-code-raw'), 'en'); break;
-      case 'delta_asc':    cmp = (a,b) => getNum(a,'data-delta',1e18) - getNum(b,'data-delta',1e18); break;
-      case 'delta_desc':   cmp = (a,b) => getNum(b,'data-delta',-1e18) - getNum(a,'data-delta',-1e18); break;
-      case 'conf_desc':    cmp = (a,b) => getNum(b,'data-conf',0) - getNum(a,'data-conf',0); break;
-      default:             cmp = (a,b) => 0;
-    }
-    cards.sort(cmp);
-    cards.forEach(c => container.appendChild(c));
+  `;
+  const WORKER_FIELDS = ['text','codeRaw','missing','diffpos','diff','diffabs','naver','official','delta','conf'];
+  // 이보다 작은 탭은 메인 스레드에서 동기로 계산 (Worker 왕복이 계산보다 비쌈)
+  const WORKER_MIN_CARDS = 3000;
+  let VIEW_WORKER = null;
+
+  function useWorkerFor(list) {
+    return VIEW_WORKER !== null && list.length >= WORKER_MIN_CARDS;
+  }
+
+  function startViewWorker() {
+    if (!('Worker' in window)) return;
+    if (!Object.values(TAB_ORDER).some(list => list.length >= WORKER_MIN_CARDS)) return;
+    try {
+      const url = URL.createObjectURL(new Blob([VIEW_WORKER_SRC], { type: 'text/javascript' }));
+      const w = new Worker(url);
+      w.onmessage = (e) => onViewResult(e.data);
+      w.onerror = () => stopViewWorker();
+      w.postMessage({
+        type: 'init',
+        entries: INDEX.map(entry => {
+          const o = {};
+          WORKER_FIELDS.forEach(k => { o[k] = entry[k]; });
+          return o;
+        }),
+        order: Object.fromEntries(Object.keys(TAB_ORDER).map(k => [k, TAB_ORDER[k].map(e => e.id)])),
+        topGap: TOP_GAP_CODES,
+      });
+      VIEW_WORKER = w;
+    } catch(e) {
+      VIEW_WORKER = null;
+    }
+  }
+
+  function stopViewWorker() {
+    // Worker 실패 시 메인 스레드 경로로 되돌리고, 현재 DOM 상태에서 다시 계산
+    if (VIEW_WORKER) { try { VIEW_WORKER.terminate(); } catch(e) {} }
+    VIEW_WORKER = null;
+    Object.values(TAB_STATE).forEach(t => { t.filterKey = null; t.sortMode = null; });
+    applyAll();
+    pendingViews = 0;
+    hideOverlay();
+    viewWaiters.splice(0).forEach(fn => fn());
+  }
+
+  function onViewResult(m) {
+    const container = document.getElementById(m.tabId);
+    const list = TAB_ORDER[m.tabId];
+    if (!container || !list) return;
+
+    if (m.flags) {
+      storeFilterFlags(m.key, m.flags);
+      // 그 사이 필터가 또 바뀌었으면 지난 결과는 캐시에만 넣고 화면에는 반영하지 않음
+      const tabState = TAB_STATE[m.tabId];
+      if (tabState && tabState.filterKey === m.key) applyFilterFlags(tabState, list, m.flags, m.filter);
+    }
+    if (m.order) {
+      const sorted = Array.from(m.order, id => INDEX[id]);
+      TAB_ORDER[m.tabId] = sorted;
+      reorderCards(container, sorted);
+    }
+    finishApply(container);
+    endView();
   }
 
   function applyGridMode() {
@@ -1643,9 +2208,38 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
     try { localStorage.setItem('gridMode', String(state.gridMode)); } catch(e){}
   }
 
+  // 탭당 한 번에 그리는 카드 수: 나머지는 window-hidden으로 두고 목록 끝 sentinel이 보이면 다음 묶음을 연다
+  const RENDER_BATCH = ('IntersectionObserver' in window) ? 500 : Infinity;
+  const RENDER_LIMIT = {};
+
+  function applyWindow(container) {
+    const limit = RENDER_LIMIT[container.id] || RENDER_BATCH;
+    let shown = 0;
+    for (const entry of (TAB_ORDER[container.id] || [])) {
+      const out = !entry.hidden && shown++ >= limit;
+      if (out !== entry.windowed) {
+        entry.windowed = out;
+        entry.el.classList.toggle('window-hidden', out);
+      }
+    }
+  }
+
+  function bindWindowSentinel() {
+    const sentinel = document.getElementById('windowSentinel');
+    if (!sentinel || !('IntersectionObserver' in window)) return;
+    new IntersectionObserver((entries) => {
+      if (!entries.some(e => e.isIntersecting)) return;
+      const container = getActiveContainer();
+      if (!container) return;
+      if (!(TAB_ORDER[container.id] || []).some(e => e.windowed)) return;
+      RENDER_LIMIT[container.id] = (RENDER_LIMIT[container.id] || RENDER_BATCH) + RENDER_BATCH;
+      applyWindow(container);
+    }, { rootMargin: '800px 0px' }).observe(sentinel);
+  }
+
   function animateVisibleCards(container) {
     if (!container) return;
-    const visibleCards = Array.from(container.querySelectorAll('.card-item:not([data-hidden="1"])'));
+    const visibleCards = (TAB_ORDER[container.id] || []).filter(e => !e.hidden && !e.windowed).map(e => e.el);
     visibleCards.forEach((card, index) => {
       card.style.setProperty('--enter-delay', `${Math.min(index * 40, 240)}ms`);
       card.classList.remove('card-in');
@@ -1661,25 +2255,84 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
     });
   }
 
+  function filterKey(tabId) {
+    // 검색어는 임의 문자열이라 구분자 충돌이 없도록 맨 뒤에 둔다
+    return [tabId, state.hasSearched ? 1 : 0, quick.diffpos ? 1 : 0, quick.missing ? 1 : 0, quick.topgap ? 1 : 0, state.q].join('|');
+  }
+
+  function cachedFilterFlags(key) {
+    const flags = FILTER_CACHE.get(key);
+    if (!flags) return null;
+    FILTER_CACHE.delete(key);
+    FILTER_CACHE.set(key, flags);
+    return flags;
+  }
+
+  function storeFilterFlags(key, flags) {
+    FILTER_CACHE.set(key, flags);
+    if (FILTER_CACHE.size > FILTER_CACHE_MAX) FILTER_CACHE.delete(FILTER_CACHE.keys().next().value);
+  }
+
+  function applyFilterFlags(tabState, list, flags, filter) {
+    // 통과 개수도 여기서 세어 두고 updateCount는 DOM을 다시 훑지 않는다
+    let visible = 0;
+    for (const entry of list) {
+      const hidden = !flags[entry.id];
+      if (!hidden) visible++;
+      if (hidden !== entry.hidden) {
+        entry.hidden = hidden;
+        entry.el.classList.toggle('filter-hidden', hidden);
+      }
+    }
+    tabState.visible = visible;
+    tabState.applied = filter;
+  }
+
+  function finishApply(container) {
+    RENDER_LIMIT[container.id] = RENDER_BATCH;
+    applyWindow(container);
+    if (container !== getActiveContainer()) return;
+    animateVisibleCards(container);
+    updateCount(TAB_STATE[container.id].visible);
+  }
+
   function applyAll() {
     const container = getActiveContainer();
     if (!container) return;
 
-    const cards = container.querySelectorAll('.card-item');
-    cards.forEach(card => {
-      const ok = passesFilters(card);
-      if (ok) {
-        card.style.display = '';
-        card.removeAttribute('data-hidden');
-      } else {
-        card.style.display = 'none';
-        card.setAttribute('data-hidden', '1');
-      }
-    });
+    const list = TAB_ORDER[container.id] || [];
+    const tabState = TAB_STATE[container.id] || (TAB_STATE[container.id] = { filterKey: null, sortMode: null, visible: list.length, applied: null });
+
+    const key = filterKey(container.id);
+    const needFilter = tabState.filterKey !== key;
+    const needSort = tabState.sortMode !== state.sortMode;
+    tabState.filterKey = key;
+    tabState.sortMode = state.sortMode;
+
+    let flags = needFilter ? cachedFilterFlags(key) : null;
+    if (flags) applyFilterFlags(tabState, list, flags, currentFilter());
+
+    if (useWorkerFor(list) && ((needFilter && !flags) || needSort)) {
+      beginView();
+      VIEW_WORKER.postMessage({
+        tabId: container.id,
+        key,
+        filter: (needFilter && !flags) ? currentFilter() : null,
+        sortMode: needSort ? state.sortMode : null,
+      });
+      return;
+    }
 
-    sortCards(container);
-    animateVisibleCards(container);
-    updateCount();
+    if (needFilter && !flags) {
+      const f = currentFilter();
+      // 조건이 좁아지기만 했으면 (검색어 이어 치기, chip 추가) 지금 보이는 카드만 다시 검사
+      const cand = isTightening(tabState.applied, f) ? list.filter(e => !e.hidden) : list;
+      flags = filterIds(cand.map(e => e.id), FILTER_BITS, f);
+      storeFilterFlags(key, flags);
+      applyFilterFlags(tabState, list, flags, f);
+    }
+    if (needSort) sortCards(container);
+    finishApply(container);
   }
 
   function onSearchClick() {
@@ -1713,9 +2366,11 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
       state.sortMode = "diffabs_desc";
       state.hasSearched = false;
 
-      document.querySelectorAll('.card-item').forEach(card => {
-        card.style.display = '';
-        card.removeAttribute('data-hidden');
+      FILTER_CACHE.clear();
+      Object.values(TAB_STATE).forEach(t => { t.filterKey = null; t.applied = null; });
+      INDEX.forEach(entry => {
+        entry.hidden = false;
+        entry.el.classList.remove('filter-hidden');
       });
 
       applyAll();
@@ -1742,7 +2397,10 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
     });
   }
 
-  function toCSV(rows) {
+  // CSV를 1000행 단위 문자열 조각 배열로 만든다 → 그대로 Blob에 넘겨 전체 문자열 복사를 피함
+  const CSV_CHUNK_ROWS = 1000;
+
+  function toCSVChunks(rows) {
     const cols = [
       "코드","상품명(영문)","상품명(한글)","공식몰가",
       "네이버최저가","가격차이","최저가몰","링크",
@@ -1758,29 +2416,31 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
       return s;
     };
 
-    let lines = [];
-    lines.push(cols.join(','));
-
-    rows.forEach(r => {
-      const code = r["코드"] || '';
-      let checked = '';
-      let memo = '';
-      try {
-        checked = (localStorage.getItem('chk_' + code) === '1') ? '1' : '0';
-        memo = localStorage.getItem('memo_' + code) || '';
-      } catch(e) {}
-
-      const enriched = Object.assign({}, r, { checked: checked, memo: memo });
-      const line = cols.map(c => escape(enriched[c]));
-      lines.push(line.join(','));
-    });
+    // 마지막 두 컬럼(checked, memo)은 row가 아니라 CARD_STATE에서 채운다
+    const nData = cols.length - 2;
+    const cells = new Array(cols.length);
+    const chunks = [cols.join(',')];
+
+    for (let start = 0; start < rows.length; start += CSV_CHUNK_ROWS) {
+      const end = Math.min(start + CSV_CHUNK_ROWS, rows.length);
+      const lines = new Array(end - start);
+      for (let i = start; i < end; i++) {
+        const r = rows[i];
+        for (let j = 0; j < nData; j++) cells[j] = escape(r[cols[j]]);
+        const code = r["코드"] || '';
+        cells[nData] = (CARD_STATE.get(keyCheck(code)) === '1') ? '1' : '0';
+        cells[nData + 1] = escape(CARD_STATE.get(keyMemo(code)) || '');
+        lines[i - start] = cells.join(',');
+      }
+      // 각 조각은 앞에 줄바꿈을 붙여 이어 붙였을 때 기존 join('\r\n') 결과와 동일
+      chunks.push('\r\n' + lines.join('\r\n'));
+    }
 
-    return lines.join('\r\n');
+    return chunks;
   }
 
-  function downloadBlob(filename, content, mime) {
-    const withBom = '\ufeff' + content;
-    const blob = new Blob([withBom], {type: mime});
+  function downloadBlob(filename, chunks, mime) {
+    const blob = new Blob(['\ufeff'].concat(chunks), {type: mime});
     const url = URL.createObjectURL(blob);
     const a = document.createElement('a');
     a.href = url;
@@ -1792,7 +2452,9 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
   }
 
   function downloadCSVAll() {
-    const csv = toCSV(ALL_ROWS);
+    const rows = getAllRows();
+    if (rows === null) return;
+    const csv = toCSVChunks(rows);
     const fname = 'result_all_' + new Date().toISOString().slice(0,10).replaceAll('-','') + '.csv';
     downloadBlob(fname, csv, 'text/csv;charset=utf-8;');
   }
@@ -1800,25 +2462,42 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
   function getFilteredRowsFromActiveTab() {
     const container = getActiveContainer();
     if (!container) return [];
-    const visible = container.querySelectorAll('.card-item:not([data-hidden="1"])');
+    const visible = container.querySelectorAll('.card-item:not(.filter-hidden)');
     const codes = Array.from(visible).map(el => el.getAttribute('data-code-raw') || '');
     const set = new Set(codes);
-    return ALL_ROWS.filter(r => set.has(r["코드"]));
+    const rows = getAllRows();
+    return rows === null ? null : rows.filter(r => set.has(r["코드"]));
   }
 
   function downloadCSVFiltered() {
-    const rows = getFilteredRowsFromActiveTab();
-    const csv = toCSV(rows);
-    const tab = getActiveTabName() || 'tab';
-    const fname = 'result_' + tab + '_filtered_' + new Date().toISOString().slice(0,10).replaceAll('-','') + '.csv';
-    downloadBlob(fname, csv, 'text/csv;charset=utf-8;');
+    whenViewsSettled(() => {
+      const rows = getFilteredRowsFromActiveTab();
+      if (rows === null) return;
+      const csv = toCSVChunks(rows);
+      const tab = getActiveTabName() || 'tab';
+      const fname = 'result_' + tab + '_filtered_' + new Date().toISOString().slice(0,10).replaceAll('-','') + '.csv';
+      downloadBlob(fname, csv, 'text/csv;charset=utf-8;');
+    });
+  }
+
+  function debounce(fn, ms) {
+    let t = null;
+    const d = (...args) => {
+      clearTimeout(t);
+      t = setTimeout(() => { t = null; fn(...args); }, ms);
+    };
+    d.cancel = () => { clearTimeout(t); t = null; };
+    return d;
   }
 
   function bindEnterToSearch(inputId) {
     const el = document.getElementById(inputId);
     if (!el) return;
+    // 입력 중에는 200ms 멈췄을 때만 미리보기 검색, Enter는 즉시 실행
+    const onType = debounce(onSearchClick, 200);
+    el.addEventListener('input', onType);
     el.addEventListener('keydown', (e) => {
-      if (e.key === 'Enter') { e.preventDefault(); onSearchClick(); }
+      if (e.key === 'Enter') { e.preventDefault(); onType.cancel(); onSearchClick(); }
     });
   }
 
@@ -1840,8 +2519,12 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
   }
 
   document.addEventListener('DOMContentLoaded', () => {
-    hydrateCardState();
+    buildIndex();
+    startViewWorker();
+    loadCardState().then(hydrateCardState);
+    bindCardControls();
     bindEnterToSearch('qAll');
+    bindWindowSentinel();
 
     try {
       const gm = localStorage.getItem('gridMode');
@@ -1877,19 +2560,21 @@ def build_html_portal(rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> str:
 </html>
 """
 
-    html = (html_tpl
-            .replace("__PREV_LABEL__", _safe_attr(prev_label))
-            .replace("__NOW_STR__", _safe_attr(now_str))
-            .replace("__TOTAL_CNT__", str(total_cnt))
-            .replace("__DIFF_POS_CNT__", str(diff_pos_cnt))
-            .replace("__MISSING_CNT__", str(missing_cnt))
-            .replace("__TAB_MENU__", tab_menu_html)
-            .replace("__CONTENT_AREA__", content_area_html)
-            .replace("__PERIOD_LABEL__", period_label)
-            .replace("__ROWS_JSON__", rows_json)
-            .replace("__TOP_GAP_CODES_JSON__", top_gap_codes_json)
-            )
-    return html
+    # .replace() 체인은 치환마다 문서 전체(카드+rows JSON, 수 MB)를 복사 → 한 번의 치환으로 조립
+    subs = {
+        "__PREV_LABEL__": _safe_attr(prev_label),
+        "__NOW_STR__": _safe_attr(now_str),
+        "__TOTAL_CNT__": str(total_cnt),
+        "__DIFF_POS_CNT__": str(diff_pos_cnt),
+        "__MISSING_CNT__": str(missing_cnt),
+        "__TAB_MENU__": tab_menu_html,
+        "__CONTENT_AREA__": content_area_html,
+        "__PERIOD_LABEL__": period_label,
+        "__ROWS_JSON__": rows_json,
+        "__TOP_GAP_CODES_JSON__": top_gap_codes_json,
+    }
+    token_re = re.compile("|".join(map(re.escape, subs)))
+    return token_re.sub(lambda m: subs[m.group(0)], html_tpl)
 
 
 # -----------------------------
@@ -1901,13 +2586,14 @@ def main():
     parser.add_argument("--output_csv", default=None, help="결과 CSV 출력 경로(기본: result_MMDD.csv)")
     parser.add_argument("--output_html", default="marketing_portal_final.html", help="결과 HTML 출력 경로")
     parser.add_argument("--delay", type=float, default=0.15, help="API 호출 간 딜레이(초)")
+    parser.add_argument("--concurrency", type=int, default=8, help="네이버 API 동시 호출 수(aiohttp 필요)")
 
     parser.add_argument("--min_price", type=int, default=None, help="네이버 최저가 하한")
     parser.add_argument("--max_price", type=int, default=None, help="네이버 최저가 상한")
     parser.add_argument("--exclude_malls", default="", help="제외할 mallName 키워드(콤마구분)")
 
     parser.add_argument("--history_dir", default=".", help="result_*.csv 누적 폴더")
-    parser.add_argument("--cache_dir", default=".naver_cache", help="네이버 API 캐시 폴더")
+    parser.add_argument("--cache_dir", default=".naver_cache", help="네이버 API 캐시 폴더(cache.sqlite)")
     parser.add_argument("--cache_ttl_hours", type=int, default=12, help="캐시 TTL(시간)")
 
     parser.add_argument("--limit", type=int, default=100, help="처리할 상위 행 개수(기본 100, 전체는 큰 숫자)")
@@ -1991,8 +2677,15 @@ def main():
     trimmed_ok = 0
     trimmed_fail = 0
 
-    log(f"🚚 START FETCH: products={len(df):,} delay={args.delay}s cache_ttl={args.cache_ttl_hours}h")
+    log(
+        f"🚚 START FETCH: products={len(df):,} delay={args.delay}s cache_ttl={args.cache_ttl_hours}h "
+        f"concurrency={args.concurrency if aiohttp is not None else '1 (aiohttp 미설치)'}"
+    )
 
+    # 1) 행 파싱 + 캐시 조회 (API 호출 없이)
+    cache_conn = open_cache_db(args.cache_dir)
+    run_ts = time.time()  # 캐시/이미지 TTL 판정 기준 시각 (행마다 다시 구하지 않음)
+    todo: List[Dict[str, Any]] = []
     for i, (_, row) in enumerate(df.iterrows(), start=1):
         style_code = str(get_row_value(row, col_code, fallback_idx=1)).strip()
         if not style_code or style_code.lower() == "nan":
@@ -2016,20 +2709,51 @@ def main():
 
         log(f"  [{i}/{len(df)}] {style_code}")
 
-        cached_items = load_cache(args.cache_dir, style_code, ttl_hours=args.cache_ttl_hours)
+        cached_items = load_cache(cache_conn, style_code, ttl_hours=args.cache_ttl_hours, now=run_ts)
         if cached_items is not None:
-            items = cached_items
-            log(f"    ✅ CACHE HIT ({len(items)} items)")
+            log(f"    ✅ CACHE HIT ({len(cached_items)} items)")
         else:
             log("    ❌ CACHE MISS -> API CALL")
-            q = f"Columbia {style_code}"
-            items = fetch_naver_shop_with_retry(q, client_id, client_secret, display=10)
-            save_cache(args.cache_dir, style_code, items)
-            log(f"    📡 API RETURN ({len(items)} items)")
 
-        items = filter_items_for_accuracy(items, style_code, args.min_price, args.max_price, exclude_malls)
-        best = pick_lowest_item(items)
-        top3_items = pick_top_n_by_price(items, n=3)
+        todo.append({
+            "idx": i,
+            "style_code": style_code,
+            "code_u": code_u,
+            "name_en": name_en,
+            "name_ko": name_ko,
+            "official_price": official_price,
+            "items": cached_items,
+        })
+
+    # 2) 캐시 miss만 모아서 한 번에 동시 호출
+    queries = [(t["style_code"], f"Columbia {t['style_code']}") for t in todo if t["items"] is None]
+    if queries:
+        t0 = time.time()
+        fetched = fetch_naver_shop_batch(
+            queries, client_id, client_secret, display=10,
+            max_concurrency=args.concurrency, delay=args.delay,
+        )
+        save_cache_many(cache_conn, list(fetched.items()), saved_at=time.time())
+        log(f"    📡 API RETURN: {len(queries):,} queries in {time.time() - t0:.1f}s")
+        for t in todo:
+            if t["items"] is None:
+                t["items"] = fetched.get(t["style_code"], [])
+
+    cache_conn.close()
+
+    # 3) 필터/최저가/이미지 처리
+    for t in todo:
+        style_code = t["style_code"]
+        code_u = t["code_u"]
+        name_en = t["name_en"]
+        name_ko = t["name_ko"]
+        official_price = t["official_price"]
+        items = t["items"] or []
+
+        # 1)과 별도 패스라 SKIP/TRIM/KEEP 로그가 어느 코드인지 알 수 있게 헤더를 다시 출력
+        log(f"  [{t['idx']}/{len(df)}] {style_code}")
+
+        items, best, top3_items = process_items(items, style_code, args.min_price, args.max_price, exclude_malls)
 
         naver_price: Optional[int] = None
         naver_link = ""
@@ -2050,19 +2774,17 @@ def main():
         if not isinstance(naver_price, int):
             skipped_no_price += 1
             log("    ⛔ SKIP: naver_price missing")
-            time.sleep(max(0.0, args.delay))
             continue
 
         if not raw_final_image or not str(raw_final_image).strip():
             skipped_no_img += 1
             log("    ⛔ SKIP: final_image missing")
-            time.sleep(max(0.0, args.delay))
             continue
 
         final_image = raw_final_image
         trimmed_local_abs = None
         if args.trim_images and Image is not None:
-            file_stem = re.sub(r"[^A-Za-z0-9_\-]", "_", code_u)
+            file_stem = _SAFE_CODE_RE.sub("_", code_u)
             referer = naver_link or None
             trimmed_url, local_abs = trim_image_to_local(
                 raw_final_image,
@@ -2070,6 +2792,7 @@ def main():
                 file_stem=file_stem,
                 referer=referer,
                 ttl_hours=args.image_ttl_hours,
+                now=run_ts,
             )
             if local_abs:
                 final_image = trimmed_url
@@ -2132,8 +2855,6 @@ def main():
             f"match={conf}/5 img=Y trim={'Y' if trimmed_local_abs else 'N'}"
         )
 
-        time.sleep(max(0.0, args.delay))
-
     log(
         f"📌 SUMMARY: kept={kept:,} "
         f"skip_excluded={skipped_excluded:,} "
@@ -2151,6 +2872,14 @@ def main():
     res_df.to_csv(out_csv, index=False, encoding="utf-8-sig")
     log(f"✅ CSV SAVED: {out_csv} (rows={len(res_df):,})")
 
+    # 다음 실행의 전일 비교용 parquet 사본 (pyarrow 없으면 생략)
+    out_parquet = _parquet_sibling(out_csv)
+    try:
+        res_df.to_parquet(out_parquet, index=False, compression="zstd")
+        log(f"✅ PARQUET SAVED: {out_parquet}")
+    except Exception as e:
+        log(f"ℹ️ parquet skipped: {e}")
+
     meta = {"generated_at": datetime.now().strftime("%Y-%m-%d %H:%M"), "prev_csv_used": prev_csv_path}
     html = build_html_portal(results, meta)
     with open(args.output_html, "w", encoding="utf-8-sig") as f: